@@ -11,15 +11,58 @@ log_filter.py
 """
 
 import argparse
+import copy
 import json
+import io
 import logging
+import mmap
+import multiprocessing
 import os
 import re
 import sys
 from datetime import datetime
+from functools import lru_cache
+from itertools import compress
+from operator import not_
 from pathlib import Path
-from typing import Dict, List, Optional, Pattern, Set
+from typing import AnyStr, Callable, Dict, List, Optional, Pattern, Set, Tuple
 
+try:
+    # google-re2: 선형 시간 DFA 기반 정규표현식 엔진 (선택 의존성)
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # hyperscan: SIMD 기반 다중 패턴 매칭 엔진 (선택 의존성)
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    # pyahocorasick: 다중 문자열 검색용 Aho-Corasick 오토마톤 (선택 의존성)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # pyarrow: 라인 묶음 단위로 정규표현식을 검사하는 벡터화 연산 커널 (선택 의존성)
+    import pyarrow
+    import pyarrow.compute as pyarrow_compute
+except ImportError:
+    pyarrow = None
+
+try:
+    # orjson: C로 구현된 JSON 파서 (선택 의존성)
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
 
 # 로깅 설정
 logging.basicConfig(
@@ -29,147 +72,1918 @@ logging.basicConfig(
 )
 logger = logging.getLogger("log_filter")
 
+# 출력 파일 버퍼 크기
+IO_BUFFER_SIZE = 4 * 1024 * 1024
+
+# 포함할 라인을 모아서 한 번에 기록하는 기준 크기
+WRITE_CHUNK_SIZE = 1024 * 1024
+
+# os.writev 한 번에 전달하는 최대 조각 수 (일반적인 IOV_MAX)
+WRITEV_MAX_CHUNKS = 1024
+
+# 라인 묶음 단위로 검사할 때 한 번에 검사하는 크기
+BATCH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Hyperscan 블록 스캔을 시작하는 크기 (매칭이 없으면 BATCH_CHUNK_SIZE까지 두 배씩 늘림)
+HYPERSCAN_MIN_BLOCK_SIZE = 1024
+
+# Hyperscan 라인 단위 검사에서 블록 스캔으로 전환하는 연속 미매칭 라인 수
+HYPERSCAN_BLOCK_SCAN_AFTER = 16
+
+# 병렬 처리 시 입력 파일을 나누는 단위 크기
+PARALLEL_CHUNK_SIZE = 16 * 1024 * 1024
+
+# 패턴 순서 최적화 시 매칭 횟수를 세는 입력 앞부분 크기
+ORDER_SAMPLE_BYTES = 64 * 1024
+
+# 사전 필터에 사용할 리터럴의 최소 길이 (짧은 리터럴은 대부분의 라인에 나타남)
+PREFILTER_MIN_LITERAL_LENGTH = 3
+
+# 사전 필터에 Aho-Corasick 오토마톤을 사용하는 최소 리터럴 수
+AHOCORASICK_MIN_LITERALS = 8
+
+
+# 패턴 맨 앞의 전역 인라인 플래그 (예: "(?i)error", "(?i)(?x)error")
+_INLINE_FLAGS_RE = re.compile(r"^(?:\(\?[aiLmsux]+\))+")
+
+# 유니코드 기준 "\d", "\w", "\s", "\b"와 ASCII 기준 결과가 달라질 수 있는 바이트
+# (ASCII가 아닌 문자의 바이트와, 문자열 패턴의 "\s"에만 매칭되는 "\x1c"~"\x1f")
+_ASCII_UNSAFE_BYTES = re.compile(rb"[\x1c-\x1f\x80-\xff]")
+_ASCII_CONTROL_BYTES = re.compile(rb"[\x1c-\x1f]")
+
+
+def _scope_inline_flags(pattern: str) -> str:
+    """
+    패턴 맨 앞의 전역 인라인 플래그를 범위 지정 플래그로 변환
+
+    여러 패턴을 하나의 alternation으로 합치면 "(?i)" 같은 전역 플래그가 패턴 중간에
+    위치하게 되어 컴파일 오류가 발생하므로 "(?i:...)" 형태로 바꿔줍니다.
+    "(?x)" 패턴은 끝의 "# 주석"이 닫는 괄호까지 삼키지 않도록 줄바꿈을 붙입니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+
+    Returns:
+        str: 변환된 패턴 (전역 플래그가 없으면 원본 그대로)
+    """
+    m = _INLINE_FLAGS_RE.match(pattern)
+    if not m:
+        return pattern
+    flags = "".join(dict.fromkeys(c for c in m.group(0) if c in "aiLmsux"))
+    body = pattern[m.end():]
+    if "x" in flags:
+        body += "\n"
+    return f"(?{flags}:{body})"
+
+
+def _iter_nodes(items):
+    """파싱된 패턴의 노드를 하위 패턴까지 순서대로 순회"""
+    for op, av in items:
+        yield op, av
+        args = av if isinstance(av, (tuple, list)) else (av,)
+        for arg in args:
+            for sub in arg if isinstance(arg, list) else (arg,):
+                if isinstance(sub, sre_parse.SubPattern):
+                    yield from _iter_nodes(sub)
+
+
+@lru_cache(maxsize=128)
+def _is_fusable(pattern: str) -> bool:
+    """
+    패턴을 다른 패턴과 하나의 alternation으로 합쳐도 되는지 확인
+
+    그룹 번호는 결합 패턴 전체에서 다시 매겨지므로 역참조("\\1", "(?(1)...)")가 다른
+    패턴의 그룹을 가리키게 되고, 이름 있는 그룹은 다른 패턴과 이름이 겹치면 컴파일
+    오류가 발생합니다. 이런 패턴은 라인마다 따로 검사합니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+
+    Returns:
+        bool: 결합 패턴에 넣을 수 있으면 True, 아니면 False
+    """
+    parsed = sre_parse.parse(pattern)
+    if parsed.state.groupdict:
+        return False
+    return not any(
+        op in (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS) for op, _ in _iter_nodes(parsed)
+    )
+
+
+@lru_cache(maxsize=128)
+def _span_pattern(pattern: str) -> Optional[str]:
+    """
+    패턴을 버퍼 구간 검색용 결합 패턴에 넣을 형태로 변환
+
+    search(buffer, start, end)에서 "\\A"는 라인 시작이 아닌 버퍼 맨 앞에서만
+    매칭되므로, 패턴 맨 앞의 "\\A"는 "(?m)" 결합 패턴에서 같은 의미인 "^"로 바꿉니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+
+    Returns:
+        Optional[str]: 변환된 패턴 (결합할 수 없거나 다른 위치에 "\\A"가 있어
+        라인을 잘라서 검사해야 하면 None)
+    """
+    if not _is_fusable(pattern):
+        return None
+    m = _INLINE_FLAGS_RE.match(pattern)
+    body_start = m.end() if m else 0
+    if pattern.startswith("\\A", body_start):
+        pattern = f"{pattern[:body_start]}^{pattern[body_start + 2:]}"
+    if any(
+        op == sre_parse.AT and av == sre_parse.AT_BEGINNING_STRING
+        for op, av in _iter_nodes(sre_parse.parse(pattern))
+    ):
+        return None
+    return pattern
+
+
+_REPEAT_OPS = tuple(
+    getattr(sre_parse, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_parse, name)
+)
+_NOT_CATEGORIES = (
+    sre_parse.CATEGORY_NOT_DIGIT,
+    sre_parse.CATEGORY_NOT_SPACE,
+    sre_parse.CATEGORY_NOT_WORD,
+)
+
+
+def _is_wildcard(item: Tuple) -> bool:
+    """파싱된 패턴 노드가 ASCII가 아닌 문자와도 매칭되는 한 글자 노드인지 확인"""
+    op, av = item
+    if op in (sre_parse.ANY, sre_parse.NOT_LITERAL):
+        return True
+    return op == sre_parse.IN and any(
+        iop == sre_parse.NEGATE or (iop == sre_parse.CATEGORY and iav in _NOT_CATEGORIES)
+        for iop, iav in av
+    )
+
+
+def _has_text_only_nodes(items, ignorecase: bool) -> bool:
+    """파싱된 패턴에 바이트 단위로 검사하면 의미가 달라지는 노드가 있는지 하위 패턴까지 확인"""
+    for op, av in items:
+        if op == sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            scoped = (ignorecase or bool(add_flags & sre_parse.SRE_FLAG_IGNORECASE)) and not (
+                del_flags & sre_parse.SRE_FLAG_IGNORECASE
+            )
+            if _has_text_only_nodes(sub, scoped):
+                return True
+            continue
+        if op in _REPEAT_OPS and av[0] <= 1 and av[1] == sre_parse.MAXREPEAT:
+            body = list(av[2])
+            if len(body) == 1 and _is_wildcard(body[0]):
+                continue
+        if _is_wildcard((op, av)):
+            return True
+        if op == sre_parse.LITERAL and av > 0x7F and ignorecase:
+            return True
+        if op == sre_parse.IN and any(
+            (iop == sre_parse.LITERAL and iav > 0x7F) or (iop == sre_parse.RANGE and iav[1] > 0x7F)
+            for iop, iav in av
+        ):
+            return True
+        args = av if isinstance(av, (tuple, list)) else (av,)
+        for arg in args:
+            for sub in arg if isinstance(arg, list) else (arg,):
+                if isinstance(sub, sre_parse.SubPattern) and _has_text_only_nodes(sub, ignorecase):
+                    return True
+    return False
+
+
+@lru_cache(maxsize=256)
+def _is_byte_safe(pattern: str, ascii_lines: bool = False) -> bool:
+    """
+    패턴을 UTF-8 바이트 패턴으로 컴파일해 바이트 라인에 검사해도 되는지 확인
+
+    바이트 패턴에서 "[가-힣]" 같은 문자 클래스의 ASCII가 아닌 문자는 개별 바이트로
+    나뉘고, "."이나 "[^a]"는 한 글자가 아닌 한 바이트와 매칭되며, 대소문자 무시는
+    ASCII 문자에만 적용됩니다. 이런 패턴은 라인을 디코딩해서 문자열 패턴으로
+    검사해야 합니다. "처리 완료" 같은 문자열은 UTF-8 바이트로 검사해도 되고,
+    길이 제한이 없는 ".*", "[^ ]+"는 UTF-8 문자의 바이트가 ASCII 바이트와 겹치지
+    않으므로 바이트로 검사해도 됩니다.
+    "\\uAC00", "\\N{...}"처럼 바이트 패턴에서 쓸 수 없는 이스케이프가 있으면
+    바이트 패턴으로 컴파일할 수 없습니다.
+
+    "\\d", "\\w", "\\s" 같은 문자 범주와 "\\b", "\\B"는 "(?a)" 없이 쓰면 문자열
+    패턴에서는 유니코드 기준으로, 바이트 패턴에서는 ASCII 기준으로 동작합니다.
+    두 결과는 _ASCII_UNSAFE_BYTES가 없는 라인에서만 같으므로, ascii_lines가 참일
+    때만 바이트로 검사해도 되는 패턴으로 판단합니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+        ascii_lines: _ASCII_UNSAFE_BYTES가 없는 라인만 검사하는지 여부
+
+    Returns:
+        bool: 바이트로 검사해도 결과가 같으면 True, 아니면 False
+    """
+    try:
+        re.compile(pattern.encode("utf-8"))
+    except re.error:
+        return False
+    parsed = sre_parse.parse(pattern)
+    flags = parsed.state.flags
+    if not ascii_lines and not flags & sre_parse.SRE_FLAG_ASCII and _has_unicode_classes(parsed):
+        return False
+    return not _has_text_only_nodes(parsed, bool(flags & sre_parse.SRE_FLAG_IGNORECASE))
+
+
+def _has_unicode_classes(items) -> bool:
+    """파싱된 패턴에 "\\d", "\\w", "\\s" 같은 문자 범주나 "\\b", "\\B"가 있는지 하위 패턴까지 확인"""
+    for op, av in _iter_nodes(items):
+        if op == sre_parse.AT and av in (sre_parse.AT_BOUNDARY, sre_parse.AT_NON_BOUNDARY):
+            return True
+        if op == sre_parse.IN and any(iop == sre_parse.CATEGORY for iop, _ in av):
+            return True
+    return False
+
+
+@lru_cache(maxsize=128)
+def _compile_regex(pattern: AnyStr) -> Pattern:
+    """
+    정규표현식 패턴을 컴파일
+
+    google-re2가 설치되어 있으면 RE2로 컴파일하고, 설치되어 있지 않거나 RE2가
+    지원하지 않는 문법(전방탐색, 역참조 등)이면 표준 re 모듈로 컴파일합니다.
+    RE2의 "\\d", "\\w", "\\s", "\\b"는 문자열 패턴에서도 ASCII 문자만 다루므로,
+    "(?a)" 없이 이런 노드를 쓰는 문자열 패턴도 re 모듈로 컴파일합니다.
+    같은 프로세스에서 같은 패턴을 다시 컴파일하지 않도록 결과를 캐시합니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+
+    Returns:
+        Pattern: 컴파일된 패턴 객체 (search() 메서드 제공)
+    """
+    if isinstance(pattern, str):
+        parsed = sre_parse.parse(pattern)
+        if not parsed.state.flags & sre_parse.SRE_FLAG_ASCII and _has_unicode_classes(parsed):
+            return re.compile(pattern)
+    if re2 is not None:
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error as e:
+            logger.debug(f"RE2에서 지원하지 않는 패턴이므로 re 모듈을 사용합니다: {str(e)}")
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=128)
+def _extract_literal(pattern: str) -> Optional[bytes]:
+    """
+    패턴이 매칭되려면 반드시 포함되어야 하는 가장 긴 리터럴 문자열을 추출
+
+    패턴의 최상위 시퀀스에서 연속된 LITERAL 노드만 고려하므로, 분기나 반복 내부의
+    문자열은 사용하지 않습니다. 대소문자 무시 플래그가 있거나 리터럴에 줄바꿈이
+    포함되면 추출하지 않습니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+
+    Returns:
+        Optional[bytes]: UTF-8로 인코딩된 리터럴 (추출할 수 없으면 None)
+    """
+    parsed = sre_parse.parse(pattern)
+    if parsed.state.flags & sre_parse.SRE_FLAG_IGNORECASE:
+        return None
+
+    longest = ""
+    current = ""
+    for op, av in parsed:
+        if op == sre_parse.LITERAL:
+            current += chr(av)
+            if len(current) > len(longest):
+                longest = current
+        else:
+            current = ""
+    if not longest or "\n" in longest:
+        return None
+    return longest.encode("utf-8")
+
+
+def _is_dot_star(item: Tuple) -> bool:
+    """파싱된 패턴 노드가 ".*" 또는 ".*?"인지 확인"""
+    op, av = item
+    return (
+        op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+        and av[0] == 0
+        and av[1] == sre_parse.MAXREPEAT
+        and list(av[2]) == [(sre_parse.ANY, None)]
+    )
+
+
+@lru_cache(maxsize=128)
+def _literal_pattern(pattern: str) -> Optional[Tuple[bytes, bool]]:
+    """
+    패턴이 단순 문자열 포함 또는 라인 시작 문자열 검사로 대체 가능한지 확인
+
+    "heartbeat" 같은 리터럴만으로 된 패턴과 "^DEBUG:" 같이 "^" 뒤에 리터럴만 오는
+    패턴이 대상이며, 양 끝의 ".*"는 검색 결과에 영향이 없으므로 무시합니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+
+    Returns:
+        Optional[Tuple[bytes, bool]]: (UTF-8로 인코딩된 리터럴, "^" 고정 여부)
+                                      또는 대체할 수 없으면 None
+    """
+    parsed = sre_parse.parse(pattern)
+    if parsed.state.flags & sre_parse.SRE_FLAG_IGNORECASE:
+        return None
+
+    items = list(parsed)
+    while items and _is_dot_star(items[-1]):
+        items.pop()
+    anchored = bool(items) and items[0] == (sre_parse.AT, sre_parse.AT_BEGINNING)
+    if anchored:
+        items.pop(0)
+    elif items and _is_dot_star(items[0]):
+        items.pop(0)
+
+    if not items or any(op != sre_parse.LITERAL for op, _ in items):
+        return None
+    literal = "".join(chr(av) for _, av in items)
+    if "\n" in literal or "\r" in literal:
+        return None
+    return literal.encode("utf-8"), anchored
+
+
+# 버퍼 전체를 검색하면 라인 단위 검사와 결과가 달라질 수 있는 노드
+# (원자 그룹과 소유 반복은 Python 3.11부터 지원)
+_LINE_DEPENDENT_OPS = (sre_parse.ASSERT, sre_parse.ASSERT_NOT) + tuple(
+    getattr(sre_parse, name)
+    for name in ("ATOMIC_GROUP", "POSSESSIVE_REPEAT")
+    if hasattr(sre_parse, name)
+)
+
+
+def _has_line_dependent_nodes(items) -> bool:
+    """파싱된 패턴에 라인 끝 너머를 보거나 되추적하지 않는 노드가 있는지 하위 패턴까지 확인"""
+    for op, av in _iter_nodes(items):
+        if op in _LINE_DEPENDENT_OPS:
+            return True
+        if op == sre_parse.AT and av in (sre_parse.AT_BEGINNING_STRING, sre_parse.AT_END_STRING):
+            return True
+    return False
+
+
+@lru_cache(maxsize=128)
+def _is_line_local(pattern: str) -> bool:
+    """
+    패턴을 버퍼 전체에서 검색해도 라인 단위 검사와 같은 결과를 얻는지 확인
+
+    라인 단위 검사는 라인 끝을 문자열 끝으로 보고 검사하므로, 라인 끝 너머를
+    보는 전후방탐색이나 문자열 시작과 끝("\\A", "\\Z")이 있는 패턴은 결과가 달라질
+    수 있습니다. 매칭이 줄바꿈을 넘어가는 경우는 검색하는 쪽에서 라인 단위로 다시
+    확인하지만, 원자 그룹("(?>...)")과 소유 반복("*+")은 줄바꿈까지 삼킨 뒤
+    되추적하지 않으므로 라인 안의 매칭을 놓칠 수 있습니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+
+    Returns:
+        bool: 버퍼 전체 검색이 가능하면 True, 아니면 False
+    """
+    return not _has_line_dependent_nodes(sre_parse.parse(pattern))
+
+
+# 줄바꿈 문자를 포함하는 문자 범주 ("\s", "\D", "\W")
+_NEWLINE_CATEGORIES = (
+    sre_parse.CATEGORY_SPACE,
+    sre_parse.CATEGORY_NOT_DIGIT,
+    sre_parse.CATEGORY_NOT_WORD,
+)
+
+
+def _set_matches_newline(items) -> bool:
+    """문자 집합 노드("[...]")가 줄바꿈 문자와 매칭되는지 확인"""
+    negate = False
+    hit = False
+    for op, av in items:
+        if op == sre_parse.NEGATE:
+            negate = True
+        elif op == sre_parse.LITERAL:
+            hit = hit or av == 0x0A
+        elif op == sre_parse.RANGE:
+            hit = hit or av[0] <= 0x0A <= av[1]
+        elif op == sre_parse.CATEGORY:
+            hit = hit or av in _NEWLINE_CATEGORIES
+    return hit != negate
+
+
+def _has_newline_nodes(items, dotall: bool) -> bool:
+    """파싱된 패턴에 줄바꿈 문자와 매칭될 수 있는 노드가 있는지 하위 패턴까지 확인"""
+    for op, av in items:
+        if op == sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            scoped = (dotall or bool(add_flags & sre_parse.SRE_FLAG_DOTALL)) and not (
+                del_flags & sre_parse.SRE_FLAG_DOTALL
+            )
+            if _has_newline_nodes(sub, scoped):
+                return True
+            continue
+        if op == sre_parse.ANY and dotall:
+            return True
+        if op == sre_parse.LITERAL and av == 0x0A:
+            return True
+        if op == sre_parse.NOT_LITERAL and av != 0x0A:
+            return True
+        if op == sre_parse.IN and _set_matches_newline(av):
+            return True
+        if op in (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS):
+            return True
+        args = av if isinstance(av, (tuple, list)) else (av,)
+        for arg in args:
+            for sub in arg if isinstance(arg, list) else (arg,):
+                if isinstance(sub, sre_parse.SubPattern) and _has_newline_nodes(sub, dotall):
+                    return True
+    return False
+
+
+@lru_cache(maxsize=128)
+def _may_match_newline(pattern: str) -> bool:
+    """
+    패턴의 매칭이 줄바꿈 문자를 포함할 수 있는지 확인
+
+    여러 라인을 한 번에 검색했을 때 이런 패턴의 매칭은 라인 하나에서의 매칭이
+    아닐 수 있으므로, 매칭이 끝난 라인을 라인 단위로 다시 확인해야 합니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+
+    Returns:
+        bool: 줄바꿈 문자와 매칭될 수 있으면 True, 아니면 False
+    """
+    parsed = sre_parse.parse(pattern)
+    return _has_newline_nodes(parsed, bool(parsed.state.flags & sre_parse.SRE_FLAG_DOTALL))
+
+
+@lru_cache(maxsize=32)
+def _load_json(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    JSON 파일을 로드 (파일 경로, 수정 시각, 크기 기준으로 캐시)
+
+    Args:
+        path: JSON 파일 경로
+        mtime_ns: 파일 수정 시각 (파일이 바뀌면 캐시를 사용하지 않기 위한 키)
+        size: 파일 크기 (수정 시각 해상도보다 빠르게 바뀐 경우를 위한 키)
+
+    Returns:
+        Dict: 로드된 JSON 데이터
+    """
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+class PatternManager:
+    """패턴 파일을 관리하고 정규표현식 패턴을 로드하는 클래스"""
+
+    def __init__(self, pattern_file: str):
+        """
+        패턴 관리자 초기화
+        
+        Args:
+            pattern_file: JSON 패턴 파일 경로
+        """
+        self.pattern_file = pattern_file
+        self.patterns_data = self._load_pattern_file()
+        
+    def _load_pattern_file(self) -> Dict:
+        """
+        패턴 파일에서 JSON 데이터를 로드
+
+        같은 프로세스에서 LogFilter를 여러 번 생성해도 파일이 바뀌지 않았다면
+        다시 파싱하지 않습니다. 캐시된 데이터는 공유되므로 복사본을 반환합니다.
+        
+        Returns:
+            Dict: 로드된 패턴 데이터
+            
+        Raises:
+            FileNotFoundError: 패턴 파일을 찾을 수 없는 경우
+            json.JSONDecodeError: JSON 형식이 잘못된 경우
+        """
+        try:
+            stat = os.stat(self.pattern_file)
+            return copy.deepcopy(_load_json(self.pattern_file, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            logger.error(f"패턴 파일을 찾을 수 없습니다: {self.pattern_file}")
+            raise
+        except json.JSONDecodeError:
+            logger.error(f"패턴 파일 형식이 잘못되었습니다: {self.pattern_file}")
+            raise
+
+    def get_module_patterns(self, module_name: str) -> List[str]:
+        """
+        지정된 모듈에 대한 패턴 목록을 반환
+        
+        Args:
+            module_name: 모듈 이름 (패턴 파일의 키)
+            
+        Returns:
+            List[str]: 정규표현식 패턴 목록
+            
+        Raises:
+            KeyError: 모듈이 패턴 파일에 없는 경우
+        """
+        if module_name not in self.patterns_data:
+            logger.error(f"'{module_name}' 모듈에 대한 패턴이 없습니다.")
+            raise KeyError(f"Module '{module_name}' not found in pattern file")
+        
+        return list(self.patterns_data[module_name].get("patterns", []))
+    
+    def get_available_modules(self) -> List[str]:
+        """
+        사용 가능한 모듈 목록을 반환
+        
+        Returns:
+            List[str]: 패턴 파일에 정의된 모듈 이름 목록
+        """
+        return list(self.patterns_data.keys())
+    
+    @staticmethod
+    def extract_pattern_code(pattern_file: str) -> str:
+        """
+        패턴 파일 이름에서 패턴 코드를 추출
+        
+        Args:
+            pattern_file: 패턴 파일 경로
+            
+        Returns:
+            str: 추출된 패턴 코드 또는 'default'
+        """
+        base = os.path.basename(pattern_file)
+        if base == "patterns.json":
+            return "default"
+        
+        m = re.match(r"patterns_(.+)\.json$", base)
+        return m.group(1) if m else os.path.splitext(base)[0]
+
+
+class LiteralScanner:
+    """
+    버퍼에서 사전 필터 리터럴이 다음에 나타나는 위치를 찾는 클래스
+
+    리터럴별로 마지막으로 찾은 위치를 기억해 두므로, 버퍼를 앞에서부터 순서대로
+    탐색하면 리터럴마다 버퍼를 한 번만 훑게 됩니다.
+    """
+
+    # Aho-Corasick 검색 시 한 번에 디코딩하는 구간 크기
+    WINDOW_SIZE = 1024 * 1024
+
+    def __init__(self, buffer, literals: List[bytes], automaton=None, end: Optional[int] = None):
+        """
+        리터럴 스캐너 초기화
+
+        Args:
+            buffer: 로그 데이터가 담긴 바이트 버퍼 (bytes 또는 mmap)
+            literals: 검색할 리터럴 목록
+            automaton: 리터럴로 만든 Aho-Corasick 오토마톤 (없으면 리터럴별로 검색)
+            end: 검색 끝 위치 (기본: 버퍼 끝)
+        """
+        self.buffer = buffer
+        self.end = len(buffer) if end is None else end
+        self.literals = literals
+        self.automaton = automaton
+        # 리터럴별 다음 출현 위치 (-2: 아직 검색하지 않음, -1: 더 이상 없음)
+        self._next = [-2] * len(literals)
+        self._hit = -2
+        self._overlap = max(len(lit) for lit in literals) - 1
+        self._window_start = 0
+        self._window_end = 0
+        self._matches = None
+
+    def next_candidate(self, pos: int) -> int:
+        """
+        pos 이후에 리터럴이 처음 나타나는 위치를 반환
+
+        Args:
+            pos: 검색 시작 위치
+
+        Returns:
+            int: 리터럴 시작 위치 (더 이상 없으면 -1)
+        """
+        if self.automaton is not None:
+            return self._next_with_automaton(pos)
+
+        best = -1
+        for i, lit in enumerate(self.literals):
+            found = self._next[i]
+            if found != -1 and found < pos:
+                found = self.buffer.find(lit, pos, self.end)
+                self._next[i] = found
+            if found != -1 and (best == -1 or found < best):
+                best = found
+        return best
+
+    def _next_with_automaton(self, pos: int) -> int:
+        """
+        Aho-Corasick 오토마톤으로 pos 이후 리터럴이 처음 나타나는 위치를 반환
+
+        버퍼를 WINDOW_SIZE 단위로 latin-1 디코딩해 구간마다 한 번씩 검색하며, 구간
+        경계에 걸친 리터럴을 놓치지 않도록 구간을 가장 긴 리터럴 길이만큼 겹칩니다.
+
+        Args:
+            pos: 검색 시작 위치
+
+        Returns:
+            int: 리터럴 시작 위치 (더 이상 없으면 -1)
+        """
+        if self._hit == -1 or self._hit >= pos:
+            return self._hit
+
+        while True:
+            if self._matches is None:
+                if self._window_end >= self.end:
+                    self._hit = -1
+                    return -1
+                # 이전 구간 끝과 겹치도록 시작하되, 이미 지나온 위치는 다시 검색하지 않음
+                self._window_start = max(self._window_end - self._overlap, pos)
+                window_end = min(self._window_start + self.WINDOW_SIZE, self.end)
+                text = self.buffer[self._window_start:window_end]
+                self._window_end = self._window_start + len(text)
+                self._matches = self.automaton.iter(text.decode("latin-1"))
+
+            for end_index, lit in self._matches:
+                start = self._window_start + end_index - len(lit) + 1
+                if start >= pos:
+                    self._hit = start
+                    return start
+            self._matches = None
+
+
+class LogFilter:
+    """
+    정규표현식 패턴을 기반으로 로그 라인을 필터링하는 클래스
+    """
+
+    def __init__(self, module_name: str, pattern_file: str):
+        """
+        로그 필터 초기화
+        
+        Args:
+            module_name: 모듈 이름 (패턴 파일의 키)
+            pattern_file: JSON 패턴 파일 경로
+        """
+        self.module_name = module_name
+        self.pattern_manager = PatternManager(pattern_file)
+        self.raw_patterns: List[str] = []
+        self.patterns: List[Pattern[str]] = []
+        self.combined: Optional[Pattern] = None
+        self.literals: Optional[List[bytes]] = None
+        self.literal_substrings: List[bytes] = []
+        self.literal_prefixes: List[bytes] = []
+        self._automaton = None
+        self._regex_patterns: List[str] = []
+        self._line_patterns: List[Pattern[bytes]] = []
+        self._text_patterns: List[Pattern[str]] = []
+        self._ascii_lines = False
+        self._ascii_filter: Optional["LogFilter"] = None
+        self._compile_patterns()
+
+    def _compile_patterns(self) -> None:
+        """
+        패턴 관리자에서 패턴을 로드하고 컴파일
+
+        개별 패턴(self.patterns)은 진단용으로만 유지하고, 실제 매칭은 모든 패턴을
+        하나의 alternation으로 합친 self.combined 로 한 번에 수행합니다.
+        중복된 패턴은 처음 나온 순서대로 하나만 남깁니다.
+        """
+        try:
+            raw_patterns = self.pattern_manager.get_module_patterns(self.module_name)
+            self.raw_patterns = list(dict.fromkeys(raw_patterns))
+            self.patterns = [re.compile(p) for p in self.raw_patterns]
+            self._build_prefilter(self.raw_patterns)
+            self._build_matchers(self._compile_engine(self.raw_patterns))
+            logger.info(f"'{self.module_name}' 모듈에 대해 {len(self.patterns)}개의 패턴을 로드했습니다.")
+        except Exception as e:
+            logger.error(f"패턴 컴파일 중 오류 발생: {str(e)}")
+            raise
+
+    def _compile_engine(self, raw_patterns: List[str]) -> List[str]:
+        """
+        하위 클래스가 별도의 매칭 엔진으로 검사할 패턴을 컴파일
+
+        하위 클래스는 엔진이 지원하는 패턴을 컴파일하고 나머지 패턴만 반환하여,
+        정규표현식 결합 패턴은 반환된 패턴으로만 만들어지게 합니다.
+
+        Args:
+            raw_patterns: 전체 정규표현식 패턴 목록
+
+        Returns:
+            List[str]: 정규표현식으로 검사할 패턴 목록 (기본: 전체 패턴)
+        """
+        return list(raw_patterns)
+
+    def _build_matchers(self, raw_patterns: List[str]) -> None:
+        """
+        정규표현식으로 검사할 패턴의 결합 패턴을 생성
+
+        역참조나 이름 있는 그룹이 있어 결합할 수 없는 패턴과 맨 앞이 아닌 위치에
+        "\\A"가 있는 패턴은 따로 컴파일해 두고 라인을 잘라서 하나씩 검사합니다.
+        바이트로 검사하면 의미가 달라지는 패턴(_is_byte_safe 참고)은 문자열 패턴으로
+        컴파일해 두고 라인을 디코딩해서 검사합니다.
+
+        Args:
+            raw_patterns: 정규표현식 패턴 목록 (결합 순서대로)
+        """
+        self._regex_patterns = list(raw_patterns)
+
+        self._text_patterns = [_compile_regex(p) for p in raw_patterns if not _is_byte_safe(p, self._ascii_lines)]
+        byte_patterns = [p for p in raw_patterns if _is_byte_safe(p, self._ascii_lines)]
+        span_patterns = [_span_pattern(p) for p in byte_patterns]
+        self.combined = self._combine([sp for sp in span_patterns if sp is not None])
+        self._line_patterns = [
+            _compile_regex(p.encode("utf-8"))
+            for p, sp in zip(byte_patterns, span_patterns)
+            if sp is None
+        ]
+
+    def _build_prefilter(self, raw_patterns: List[str]) -> None:
+        """
+        모든 패턴의 필수 리터럴로 사전 필터를 생성
+
+        모든 패턴에서 필수 리터럴을 추출할 수 있으면, 어떤 리터럴도 포함하지 않는
+        라인은 패턴 검사 없이 바로 포함으로 판단할 수 있습니다. 리터럴이 없거나
+        PREFILTER_MIN_LITERAL_LENGTH보다 짧은 패턴이 하나라도 있으면 사전 필터를
+        사용하지 않습니다. 하위 클래스가 일부 패턴을 다른 엔진으로 검사하더라도
+        사전 필터는 항상 전체 패턴으로 만들어야 합니다.
+
+        모든 패턴이 단순 문자열 포함("heartbeat") 또는 라인 시작 문자열("^DEBUG:")이면
+        literal_substrings와 literal_prefixes에 리터럴을 기록하여, 사전 필터가 찾은
+        리터럴 위치만으로 정규표현식 없이 제외 여부를 판단할 수 있게 합니다.
+        라인마다 여러 번 bytes.find를 호출하는 것보다 결합 패턴 하나로 검사하는 편이
+        빠르므로, 리터럴 위치만으로 판단할 수 없는 라인은 결합 패턴으로 검사합니다.
+
+        Args:
+            raw_patterns: 전체 정규표현식 패턴 목록
+        """
+        self.literals = None
+        self.literal_substrings = []
+        self.literal_prefixes = []
+        self._automaton = None
+        if not raw_patterns:
+            return
+
+        literals = [_extract_literal(p) for p in raw_patterns]
+        if any(lit is None or len(lit) < PREFILTER_MIN_LITERAL_LENGTH for lit in literals):
+            return
+        literal_patterns = [_literal_pattern(p) for p in raw_patterns]
+        if all(lp is not None for lp in literal_patterns):
+            self.literal_substrings = list(dict.fromkeys(lit for lit, anchored in literal_patterns if not anchored))
+            self.literal_prefixes = list(dict.fromkeys(lit for lit, anchored in literal_patterns if anchored))
+        self.literals = list(dict.fromkeys(literals))
+
+        if ahocorasick is not None and len(self.literals) >= AHOCORASICK_MIN_LITERALS:
+            # 바이트를 latin-1로 1:1 대응시켜 문자열 오토마톤으로 검색
+            self._automaton = ahocorasick.Automaton()
+            for lit in self.literals:
+                self._automaton.add_word(lit.decode("latin-1"), lit)
+            self._automaton.make_automaton()
+
+    def optimize_order(self, buffer) -> None:
+        """
+        입력 앞부분에서 자주 매칭되는 패턴이 alternation 앞쪽에 오도록 재정렬
+
+        버퍼 앞 ORDER_SAMPLE_BYTES 크기에서 패턴별 매칭 횟수를 세어 많이 매칭된
+        순서로 정렬합니다. 매칭되는 라인에서 앞쪽 대안이 먼저 성공하므로 나머지 대안을
+        시도하지 않게 됩니다. 매칭 횟수는 라인으로 나누지 않고 findall로 한 번에
+        세므로 대략적인 값입니다. 바이트로 검사할 수 없는 패턴은 디코딩한 샘플에서
+        셉니다. 라인 검사와 같이 _compile_regex로 컴파일하므로, RE2가 설치되어 있으면
+        "^(a+)+$" 같은 패턴도 샘플 검사에서 지수 시간이 걸리지 않습니다.
+
+        Args:
+            buffer: 입력 로그 데이터 (bytes 또는 mmap)
+        """
+        if len(self._regex_patterns) < 2:
+            return
+
+        sample = buffer[:ORDER_SAMPLE_BYTES]
+        text = None
+        hits = {}
+        for p in self._regex_patterns:
+            pattern = f"(?m){_scope_inline_flags(p)}"
+            if _is_byte_safe(p):
+                hits[p] = len(_compile_regex(pattern.encode("utf-8")).findall(sample))
+            else:
+                if text is None:
+                    text = sample.decode("utf-8", "replace")
+                hits[p] = len(_compile_regex(pattern).findall(text))
+
+        ordered = sorted(self._regex_patterns, key=lambda p: -hits[p])
+        if ordered != self._regex_patterns:
+            logger.debug(f"패턴 검사 순서를 변경했습니다: {ordered}")
+            self._build_matchers(ordered)
+            self._ascii_filter = None
+
+    def ascii_filter(self) -> Optional["LogFilter"]:
+        """
+        _ASCII_UNSAFE_BYTES가 없는 라인을 검사할 로그 필터를 반환
+
+        "\\d", "\\w", "\\s", "\\b"를 쓰는 패턴은 문자열 패턴으로 검사하지만, 이런 라인에서는
+        바이트 패턴과 결과가 같습니다. 이 패턴들도 바이트 패턴과 매칭 엔진으로 검사하는
+        로그 필터를 만들어 두어, 대부분의 라인은 디코딩 없이 검사할 수 있게 합니다.
+
+        Returns:
+            Optional[LogFilter]: 같은 클래스의 로그 필터 (이런 패턴이 없으면 None)
+        """
+        if self._ascii_lines or all(
+            _is_byte_safe(p) or not _is_byte_safe(p, True) for p in self.raw_patterns
+        ):
+            return None
+        if self._ascii_filter is None:
+            ascii_filter = copy.copy(self)
+            ascii_filter._ascii_lines = True
+            regex_patterns = ascii_filter._compile_engine(self.raw_patterns)
+            # 정규표현식으로 검사할 패턴은 optimize_order로 정한 순서를 따름
+            order = {p: i for i, p in enumerate(self._regex_patterns)}
+            ascii_filter._build_matchers(sorted(regex_patterns, key=lambda p: order.get(p, len(order))))
+            self._ascii_filter = ascii_filter
+        return self._ascii_filter
+
+    def literal_scanner(self, buffer, end: Optional[int] = None) -> Optional["LiteralScanner"]:
+        """
+        버퍼에서 사전 필터 리터럴의 출현 위치를 찾는 스캐너를 생성
+
+        Args:
+            buffer: 로그 데이터가 담긴 바이트 버퍼 (bytes 또는 mmap)
+            end: 검색 끝 위치 (기본: 버퍼 끝)
+
+        Returns:
+            Optional[LiteralScanner]: 스캐너 (사전 필터를 사용할 수 없으면 None)
+        """
+        if self.literals is None:
+            return None
+        return LiteralScanner(buffer, self.literals, self._automaton, end)
+
+    @staticmethod
+    def _combine(raw_patterns: List[str]) -> Optional[Pattern]:
+        """
+        패턴 목록을 하나의 alternation 패턴으로 결합하여 컴파일
+
+        결합된 패턴은 버퍼의 [start, end) 구간을 한 라인으로 검사할 수 있도록
+        바이트 패턴으로 컴파일하며, 구간 시작 위치에서도 "^"가 매칭되도록
+        MULTILINE 플래그를 사용합니다.
+
+        Args:
+            raw_patterns: 정규표현식 패턴 목록
+
+        Returns:
+            Optional[Pattern]: 결합된 패턴 (패턴이 없으면 None)
+        """
+        if not raw_patterns:
+            return None
+        joined = "(?m)" + "|".join(f"(?:{_scope_inline_flags(p)})" for p in raw_patterns)
+        return _compile_regex(joined.encode("utf-8"))
+
+    def should_exclude(self, log_line: bytes) -> bool:
+        """
+        로그 라인이 제외되어야 하는지 확인
+        
+        로그 라인은 디코딩하지 않은 바이트 그대로 검사합니다. 라인 끝의 줄바꿈
+        문자("\\n" 또는 "\\r\\n")는 LogProcessor와 동일하게 매칭 전에 제거합니다.
+
+        Args:
+            log_line: 검사할 로그 라인 (bytes)
+            
+        Returns:
+            bool: 로그 라인이 어떤 패턴과도 매칭되면 True(제외), 아니면 False(포함)
+        """
+        end = len(log_line)
+        if log_line.endswith(b"\n"):
+            end -= 2 if log_line.endswith(b"\r\n") else 1
+        return self.should_exclude_span(log_line, 0, end)
+
+    def should_exclude_span(self, buffer, start: int, end: int) -> bool:
+        """
+        버퍼의 [start, end) 구간(줄바꿈 문자 제외)이 제외되어야 하는지 확인
+
+        Args:
+            buffer: 로그 데이터가 담긴 바이트 버퍼 (bytes 또는 mmap)
+            start: 라인 시작 위치
+            end: 라인 끝 위치 (줄바꿈 문자 위치)
+
+        Returns:
+            bool: 구간이 어떤 패턴과도 매칭되면 True(제외), 아니면 False(포함)
+        """
+        if self.combined is not None:
+            # RE2는 endpos 뒤의 문자까지 보고 "$"를 판단하므로, 구간 끝이 "\n" 앞이 아니면
+            # (CRLF의 "\r" 앞 등) 구간을 잘라서 검사
+            if end < len(buffer) and buffer[end] != 0x0A:
+                if self.combined.search(buffer[start:end]) is not None:
+                    return True
+            elif self.combined.search(buffer, start, end) is not None:
+                return True
+        if self._line_patterns or self._text_patterns:
+            line = buffer[start:end]
+            if any(p.search(line) is not None for p in self._line_patterns):
+                return True
+            if self._text_patterns:
+                text = line.decode("utf-8", "replace")
+                return any(p.search(text) is not None for p in self._text_patterns)
+        return False
+
+    def exclude_batch(self, lines: List[bytes]) -> List[bool]:
+        """
+        라인 목록(줄바꿈 문자 제외)을 검사하여 라인별 제외 여부를 반환
+
+        Args:
+            lines: 검사할 라인 목록
+
+        Returns:
+            List[bool]: 라인이 어떤 패턴과도 매칭되면 True(제외), 아니면 False(포함)
+        """
+        return [self.should_exclude_span(line, 0, len(line)) for line in lines]
+
+    def span_matcher(self) -> Callable:
+        """
+        "\n" 바로 앞 또는 버퍼 끝에서 끝나는 구간을 검사하는 함수를 반환
+
+        대부분의 라인은 이 조건을 만족하므로, 라인 검사 루프에서 should_exclude_span
+        대신 결합 패턴의 search를 직접 호출해 메서드 호출 비용을 줄일 수 있습니다.
+
+        Returns:
+            Callable: (buffer, start, end)를 받아 참이면 제외를 뜻하는 값을 반환하는 함수
+        """
+        if self.combined is None or self._line_patterns or self._text_patterns:
+            return self.should_exclude_span
+        return self.combined.search
+
+    def batch_matcher(self) -> Optional[Callable]:
+        """
+        여러 라인을 한 번에 검사하는 함수를 반환
+
+        Returns:
+            Optional[Callable]: 라인 목록을 받아 라인별 제외 여부 목록을 반환하는 함수
+                                (라인 묶음 검사를 지원하지 않으면 None)
+        """
+        return None
+
+    def buffer_matcher(self) -> Optional[Callable]:
+        """
+        버퍼 전체에서 다음 매칭을 찾는 함수를 반환
+
+        결합 패턴은 MULTILINE 플래그로 컴파일되어 있으므로, 모든 패턴이 라인 밖을
+        보지 않는다면 라인을 나누지 않고 버퍼 전체를 한 번에 검색할 수 있습니다.
+        RE2 바인딩은 매칭 위치를 구하는 비용이 커서 매칭이 많으면 라인 단위 검사보다
+        느려지므로, re 모듈로 컴파일된 경우에만 사용합니다.
+
+        Returns:
+            Optional[Callable]: (buffer, pos, endpos)를 받아 매칭 객체를 반환하는 함수
+                                (버퍼 전체 검색을 사용할 수 없으면 None)
+        """
+        if not isinstance(self.combined, re.Pattern) or self._line_patterns or self._text_patterns:
+            return None
+        if not all(_is_line_local(_span_pattern(p)) for p in self._regex_patterns):
+            return None
+        return self.combined.search
+
+
+def _stop_on_match(*_args) -> bool:
+    """Hyperscan 매칭 콜백: 첫 매칭에서 스캔을 중단"""
+    return True
+
+
+def _stop_on_line_match(_expr_id, _start, end, _flags, line_length: int) -> bool:
+    """Hyperscan 매칭 콜백: 라인 안에서 끝나는(end <= line_length) 첫 매칭에서 스캔을 중단"""
+    return end <= line_length
+
+
+class HyperscanFilter(LogFilter):
+    """
+    Hyperscan 다중 패턴 데이터베이스를 사용하는 로그 필터
+
+    모든 패턴을 하나의 SIMD 오토마톤으로 컴파일해 한 번의 스캔으로 검사합니다.
+    Hyperscan이 지원하지 않는 패턴(전방탐색, 역참조 등)은 정규표현식으로 검사합니다.
+
+    라인마다 스캔하지 않고 줄바꿈 단위로 자른 블록을 한 번에 스캔한 뒤, 매칭 위치를
+    라인으로 바꿔 매칭된 라인만 처리합니다.
+
+    save_database()로 저장한 데이터베이스 파일(.hsdb)이 패턴 파일 옆에 있고 패턴이
+    바뀌지 않았으면, 컴파일하지 않고 저장된 데이터베이스를 불러옵니다.
+    """
+
+    # 데이터베이스 파일 형식 버전 (컴파일 플래그나 지원 패턴 기준이 바뀌면 이전 파일을 사용하지 않음)
+    DATABASE_FORMAT = 4
+
+    def __init__(self, module_name: str, pattern_file: str):
+        """
+        Hyperscan 로그 필터 초기화
+
+        Args:
+            module_name: 모듈 이름 (패턴 파일의 키)
+            pattern_file: JSON 패턴 파일 경로
+        """
+        self.database = None
+        self.hyperscan_patterns: List[str] = []
+        self._newline_ids: frozenset = frozenset()
+        self._block_scan = False
+        super().__init__(module_name, pattern_file)
+
+    def _compile_engine(self, raw_patterns: List[str]) -> List[str]:
+        """
+        Hyperscan이 지원하는 패턴으로 데이터베이스를 생성
+
+        Args:
+            raw_patterns: 전체 정규표현식 패턴 목록
+
+        Returns:
+            List[str]: Hyperscan이 지원하지 않아 정규표현식으로 검사할 패턴 목록
+        """
+        # ASCII 라인용 로그 필터는 지원 패턴이 달라 저장된 데이터베이스를 사용하지 않음
+        loaded = None if self._ascii_lines else self._load_database(self.database_path())
+        if loaded is not None:
+            self.database, supported = loaded
+        else:
+            supported = [
+                p for p in raw_patterns
+                if _is_byte_safe(p, self._ascii_lines) and self._build_database((p,)) is not None
+            ]
+            self.database = (
+                self._build_database(tuple(supported), self._is_block_scannable(supported)) if supported else None
+            )
+        unsupported = [p for p in raw_patterns if p not in supported]
+        self.hyperscan_patterns = supported
+        # 블록 스캔에서 매칭이 줄바꿈을 넘었을 수 있어 라인 단위로 다시 확인할 패턴
+        self._newline_ids = frozenset(i for i, p in enumerate(supported) if _may_match_newline(p))
+        self._block_scan = self.database is not None and self._is_block_scannable(supported)
+        logger.debug(
+            f"Hyperscan 패턴 {len(supported)}개, 정규표현식 패턴 {len(unsupported)}개"
+        )
+        return unsupported
+
+    @staticmethod
+    def _is_block_scannable(raw_patterns: List[str]) -> bool:
+        """
+        패턴 목록을 여러 라인을 묶은 블록으로 스캔할 수 있는지 확인
+
+        "\\A", "\\Z"는 블록 스캔에서 라인이 아닌 블록의 시작과 끝에서 매칭되므로,
+        이런 패턴이 있으면 라인마다 스캔해야 합니다.
+
+        Args:
+            raw_patterns: 정규표현식 패턴 목록
+
+        Returns:
+            bool: 블록으로 스캔할 수 있으면 True, 아니면 False
+        """
+        return not any(
+            op == sre_parse.AT and av in (sre_parse.AT_BEGINNING_STRING, sre_parse.AT_END_STRING)
+            for p in raw_patterns
+            for op, av in _iter_nodes(sre_parse.parse(p))
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_database(raw_patterns: Tuple[str, ...], multiline: bool = False):
+        """
+        패턴 목록으로 Hyperscan 블록 모드 데이터베이스를 생성 (패턴 목록 기준으로 캐시)
+
+        multiline이 참이면 여러 라인을 한 번에 스캔할 수 있도록 MULTILINE 플래그로
+        컴파일하므로 "^", "$"는 라인 경계에서 매칭됩니다. 이 데이터베이스는 데이터 끝의
+        라인에서 매칭을 놓칠 수 있으므로, 라인 하나를 스캔할 때는 빈 라인을 덧붙여야
+        합니다.
+
+        Args:
+            raw_patterns: 정규표현식 패턴 목록
+            multiline: MULTILINE 플래그로 컴파일할지 여부
+
+        Returns:
+            hyperscan.Database: 컴파일된 데이터베이스 (지원하지 않는 패턴이 있으면 None)
+        """
+        flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+        if multiline:
+            flags |= hyperscan.HS_FLAG_MULTILINE
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[p.encode("utf-8") for p in raw_patterns],
+                ids=list(range(len(raw_patterns))),
+                elements=len(raw_patterns),
+                flags=[flags] * len(raw_patterns),
+            )
+        except hyperscan.error:
+            return None
+        return database
+
+    def database_path(self) -> str:
+        """
+        패턴 파일 옆에 저장되는 데이터베이스 파일 경로를 반환
+
+        Returns:
+            str: "<패턴 파일 이름>.<모듈 이름>.hsdb" 형식의 경로
+        """
+        stem = os.path.splitext(self.pattern_manager.pattern_file)[0]
+        return f"{stem}.{self.module_name}.hsdb"
+
+    def save_database(self) -> str:
+        """
+        컴파일된 데이터베이스를 직렬화하여 database_path()에 저장
+
+        파일은 모듈 이름과 패턴 목록을 담은 JSON 헤더 한 줄과 hyperscan.dumpb()로
+        직렬화한 데이터베이스 바이트로 구성됩니다.
+
+        Returns:
+            str: 저장한 파일 경로
+
+        Raises:
+            IOError: 파일 쓰기 오류 발생 시
+        """
+        path = self.database_path()
+        header = {
+            "format": self.DATABASE_FORMAT,
+            "module": self.module_name,
+            "patterns": list(self.raw_patterns),
+            "supported": list(self.hyperscan_patterns),
+        }
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+            if self.database is not None:
+                f.write(hyperscan.dumpb(self.database))
+        os.replace(tmp_path, path)
+        return path
+
+    def _load_database(self, path: str):
+        """
+        저장된 데이터베이스 파일을 불러옴
+
+        모듈 이름이나 패턴 목록이 현재와 다르거나, 헤더 형식이 올바르지 않거나,
+        현재 Hyperscan에서 불러올 수 없는 파일은 사용하지 않습니다.
+
+        Args:
+            path: 데이터베이스 파일 경로
+
+        Returns:
+            Optional[Tuple[hyperscan.Database, List[str]]]: (데이터베이스, 데이터베이스에
+                포함된 패턴 목록) 또는 사용할 수 없으면 None
+        """
+        try:
+            with open(path, "rb") as f:
+                header_line, _, data = f.read().partition(b"\n")
+            header = _json_loads(header_line)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"데이터베이스 파일을 읽을 수 없습니다: {path} ({str(e)})")
+            return None
+
+        if not isinstance(header, dict) or not all(
+            isinstance(header.get(key), list) and all(isinstance(p, str) for p in header[key])
+            for key in ("patterns", "supported")
+        ):
+            logger.warning(f"데이터베이스 파일 형식이 올바르지 않습니다: {path}")
+            return None
+        if header.get("format") != self.DATABASE_FORMAT:
+            logger.debug(f"데이터베이스 파일 형식 버전이 달라 사용하지 않습니다: {path}")
+            return None
+        if header.get("module") != self.module_name or sorted(header["patterns"]) != sorted(self.raw_patterns):
+            logger.debug(f"패턴이 변경되어 데이터베이스 파일을 사용하지 않습니다: {path}")
+            return None
+        supported = header["supported"]
+        if not set(supported) <= set(self.raw_patterns):
+            logger.warning(f"데이터베이스 파일 형식이 올바르지 않습니다: {path}")
+            return None
+        if not data:
+            return None, supported
+        try:
+            database = hyperscan.loadb(data, hyperscan.HS_MODE_BLOCK)
+            database.scratch = hyperscan.Scratch(database)
+        except hyperscan.error as e:
+            logger.warning(f"데이터베이스 파일을 불러올 수 없습니다: {path} ({str(e)})")
+            return None
+        logger.debug(f"데이터베이스 파일을 불러왔습니다: {path}")
+        return database, supported
+
+    def should_exclude_span(self, buffer, start: int, end: int) -> bool:
+        """
+        버퍼의 [start, end) 구간(줄바꿈 문자 제외)이 제외되어야 하는지 확인
+
+        Args:
+            buffer: 로그 데이터가 담긴 바이트 버퍼 (bytes 또는 mmap)
+            start: 라인 시작 위치
+            end: 라인 끝 위치 (줄바꿈 문자 위치)
+
+        Returns:
+            bool: 구간이 어떤 패턴과도 매칭되면 True(제외), 아니면 False(포함)
+        """
+        if self.database is not None:
+            try:
+                if self._block_scan:
+                    # MULTILINE 데이터베이스는 데이터 끝의 라인에서 매칭을 놓칠 수 있으므로
+                    # 줄바꿈과 다음 라인의 첫 바이트(없으면 빈 라인)를 덧붙여 스캔
+                    if end + 2 <= len(buffer) and buffer[end] == 0x0A:
+                        data = buffer[start:end + 2]
+                    else:
+                        data = buffer[start:end] + b"\n\n"
+                    # (match_event_handler, flags, context) 순서의 위치 인자가 키워드 인자보다 빠름
+                    self.database.scan(data, _stop_on_line_match, 0, end - start)
+                else:
+                    self.database.scan(buffer[start:end], match_event_handler=_stop_on_match)
+            except hyperscan.ScanTerminated:
+                return True
+        return super().should_exclude_span(buffer, start, end)
+
+    def _scan_block(self, buffer, pos: int, end: int, size: int) -> Tuple[int, Optional[int], bool]:
+        """
+        [pos, end)에서 size 바이트 안의 완전한 라인들을 블록 하나로 스캔하여 첫 매칭 위치를 찾음
+
+        버퍼를 복사하지 않도록 블록을 memoryview로 전달합니다. Hyperscan은 MULTILINE
+        데이터 끝의 라인에서 매칭을 놓칠 수 있으므로, 블록의 마지막 라인은 첫 바이트만
+        덧붙여 스캔하고 다음 블록에서 다시 스캔합니다. 라인이 하나뿐이면 그 라인만
+        스캔합니다. Hyperscan은 첫 매칭을 보고하기 전에 블록 앞부분을 미리 처리하므로,
+        매칭이 가까이 있을 때는 작은 블록을 스캔하는 것이 빠릅니다.
+
+        매칭은 끝 위치 순서로 보고되지만, "$"나 "\\b"처럼 다음 바이트를 봐야 하는 매칭은
+        한 바이트 늦게 보고될 수 있습니다. 따라서 첫 매칭에서 스캔을 중단하되, 매칭 끝이
+        라인 시작이면 호출하는 쪽에서 앞 라인도 다시 검사해야 합니다.
+
+        Args:
+            buffer: 로그 데이터가 담긴 바이트 버퍼 (bytes 또는 mmap)
+            pos: 블록 시작 위치 (라인 시작 위치)
+            end: 스캔 끝 위치 (라인 끝 다음 위치 또는 버퍼 끝)
+            size: 블록 크기
+
+        Returns:
+            Tuple[int, Optional[int], bool]: (다음 블록 시작 위치, 첫 매칭의 끝 위치 또는
+                매칭이 없으면 None, 매칭이 줄바꿈을 넘었을 수 있어 라인을 다시 검사해야
+                하는지 여부)
+        """
+        last_newline = buffer.rfind(b"\n", pos, min(end, pos + size) - 1)
+        if last_newline == -1:
+            scan_end = buffer.find(b"\n", pos, end)
+            if scan_end == -1:
+                scan_end = end
+            next_pos = min(scan_end + 1, end)
+        else:
+            # 마지막 라인의 첫 바이트까지 스캔
+            scan_end = last_newline + 2
+            next_pos = last_newline + 1
+            
+        found = []
+        
+        def on_match(expr_id, _from, to, _flags, _context):
+            found.append((expr_id, to))
+            return True
+            
+        with memoryview(buffer)[pos:scan_end] as block:
+            try:
+                self.database.scan(block, match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
+                
+        if not found:
+            return next_pos, None, False
+        expr_id, to = found[0]
+        match_end = pos + to
+        if match_end > next_pos:
+            # 다음 블록에서 다시 스캔할 마지막 라인의 매칭
+            return next_pos, None, False
+        return next_pos, match_end, match_end == next_pos or expr_id in self._newline_ids
+
+    def span_matcher(self) -> Callable:
+        """
+        라인 검사 루프에서 사용할 검사 함수를 반환
 
-class PatternManager:
-    """패턴 파일을 관리하고 정규표현식 패턴을 로드하는 클래스"""
+        블록 스캔을 사용할 수 있으면, 블록을 스캔해 찾은 첫 매칭 위치를 기억해 두고
+        그 위치가 속한 라인만 Hyperscan 매칭으로 처리합니다. 매칭 끝이 라인 시작이면
+        앞 라인도 라인 단위로 다시 검사합니다. 그 밖의 라인들은 정규표현식으로 검사할
+        패턴만 확인합니다.
 
-    def __init__(self, pattern_file: str):
+        매칭되는 라인이 몰려 있으면 블록 스캔이 라인마다 다시 시작되어 라인 단위
+        검사보다 느려지므로, 블록의 첫 라인이 매칭되면 라인 단위 검사로 바꾸고
+        HYPERSCAN_BLOCK_SCAN_AFTER개 라인이 연속으로 매칭되지 않으면 블록 스캔으로
+        돌아갑니다.
+
+        Returns:
+            Callable: (buffer, start, end)를 받아 라인 제외 여부를 반환하는 함수
         """
-        패턴 관리자 초기화
+        if not self._block_scan:
+            return self.should_exclude_span
+        should_exclude_span = self.should_exclude_span
+        regex_exclude = None
+        if self.combined is not None or self._line_patterns or self._text_patterns:
+            regex_exclude = super().should_exclude_span
+        scan_from = scan_to = 0
+        match_end = None
+        spanning = False
+        size = HYPERSCAN_MIN_BLOCK_SIZE
+        misses = HYPERSCAN_BLOCK_SCAN_AFTER
         
+        def matches(buffer, start: int, end: int) -> bool:
+            nonlocal scan_from, scan_to, match_end, spanning, size, misses
+            if misses < HYPERSCAN_BLOCK_SCAN_AFTER:
+                excluded = should_exclude_span(buffer, start, end)
+                misses = 0 if excluded else misses + 1
+                return excluded
+            if start < scan_from or (start >= scan_to if match_end is None else start > match_end):
+                # 직전 블록에 매칭이 없었으면 블록 크기를 늘림
+                if match_end is None and start == scan_to:
+                    size = min(size * 2, BATCH_CHUNK_SIZE)
+                else:
+                    size = HYPERSCAN_MIN_BLOCK_SIZE
+                scan_from = start
+                scan_to, match_end, spanning = self._scan_block(buffer, start, len(buffer), size)
+            if match_end is not None and match_end <= end:
+                if start == scan_from:
+                    misses = 0
+                return not spanning or should_exclude_span(buffer, start, end)
+            if match_end == end + 1:
+                return should_exclude_span(buffer, start, end)
+            return regex_exclude is not None and regex_exclude(buffer, start, end)
+            
+        return matches
+
+    def buffer_matcher(self) -> Optional[Callable]:
+        """
+        버퍼 전체에서 다음 매칭을 찾는 함수를 반환
+
+        Returns:
+            Optional[Callable]: 결합 패턴이 Hyperscan 패턴을 포함하지 않으므로 항상 None
+        """
+        return None
+
+
+class ArrowFilter(LogFilter):
+    """
+    pyarrow 연산 커널로 라인 묶음을 한 번에 검사하는 로그 필터
+
+    라인 묶음을 Arrow 배열로 만들어 match_substring_regex(C++ RE2) 한 번으로 검사하므로
+    라인마다 Python에서 검사 함수를 호출하지 않습니다. RE2가 지원하지 않는 패턴
+    (전방탐색, 역참조 등)은 정규표현식으로 검사합니다.
+    """
+
+    def __init__(self, module_name: str, pattern_file: str):
+        """
+        Arrow 로그 필터 초기화
+
         Args:
+            module_name: 모듈 이름 (패턴 파일의 키)
             pattern_file: JSON 패턴 파일 경로
         """
-        self.pattern_file = pattern_file
-        self.patterns_data = self._load_pattern_file()
-        
-    def _load_pattern_file(self) -> Dict:
+        self.arrow_pattern: Optional[str] = None
+        super().__init__(module_name, pattern_file)
+
+    def _compile_engine(self, raw_patterns: List[str]) -> List[str]:
         """
-        패턴 파일에서 JSON 데이터를 로드
-        
+        Arrow가 지원하는 패턴으로 Arrow 결합 패턴을 생성
+
+        Args:
+            raw_patterns: 전체 정규표현식 패턴 목록
+
         Returns:
-            Dict: 로드된 패턴 데이터
-            
-        Raises:
-            FileNotFoundError: 패턴 파일을 찾을 수 없는 경우
-            json.JSONDecodeError: JSON 형식이 잘못된 경우
+            List[str]: Arrow가 지원하지 않아 정규표현식으로 검사할 패턴 목록
         """
-        try:
-            with open(self.pattern_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.error(f"패턴 파일을 찾을 수 없습니다: {self.pattern_file}")
-            raise
-        except json.JSONDecodeError:
-            logger.error(f"패턴 파일 형식이 잘못되었습니다: {self.pattern_file}")
-            raise
+        supported = [
+            p for p in raw_patterns
+            if _is_fusable(p) and _is_byte_safe(p, self._ascii_lines) and self._arrow_supports(p)
+        ]
+        unsupported = [p for p in raw_patterns if p not in supported]
+        self.arrow_pattern = (
+            "|".join(f"(?:{_scope_inline_flags(p)})" for p in supported) if supported else None
+        )
+        logger.debug(
+            f"Arrow 패턴 {len(supported)}개, 정규표현식 패턴 {len(unsupported)}개"
+        )
+        return unsupported
 
-    def get_module_patterns(self, module_name: str) -> List[str]:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _arrow_supports(pattern: str) -> bool:
         """
-        지정된 모듈에 대한 패턴 목록을 반환
-        
+        Arrow의 정규표현식 엔진(RE2)이 패턴을 지원하는지 확인
+
         Args:
-            module_name: 모듈 이름 (패턴 파일의 키)
-            
+            pattern: 정규표현식 패턴
+
         Returns:
-            List[str]: 정규표현식 패턴 목록
-            
-        Raises:
-            KeyError: 모듈이 패턴 파일에 없는 경우
+            bool: 지원하면 True, 아니면 False
         """
-        if module_name not in self.patterns_data:
-            logger.error(f"'{module_name}' 모듈에 대한 패턴이 없습니다.")
-            raise KeyError(f"Module '{module_name}' not found in pattern file")
-        
-        return self.patterns_data[module_name].get("patterns", [])
-    
-    def get_available_modules(self) -> List[str]:
+        try:
+            pyarrow_compute.match_substring_regex(pyarrow.array([b""], pyarrow.binary()), pattern)
+        except pyarrow.ArrowInvalid:
+            return False
+        return True
+
+    def exclude_batch(self, lines: List[bytes]) -> List[bool]:
         """
-        사용 가능한 모듈 목록을 반환
-        
+        라인 목록(줄바꿈 문자 제외)을 한 번에 검사하여 라인별 제외 여부를 반환
+
+        Args:
+            lines: 검사할 라인 목록
+
         Returns:
-            List[str]: 패턴 파일에 정의된 모듈 이름 목록
+            List[bool]: 라인이 어떤 패턴과도 매칭되면 True(제외), 아니면 False(포함)
         """
-        return list(self.patterns_data.keys())
-    
-    @staticmethod
-    def extract_pattern_code(pattern_file: str) -> str:
+        if self.arrow_pattern is None:
+            mask = [False] * len(lines)
+        else:
+            array = pyarrow.array(lines, pyarrow.binary())
+            mask = pyarrow_compute.match_substring_regex(array, self.arrow_pattern).to_pylist()
+        if self.combined is not None or self._line_patterns or self._text_patterns:
+            regex_exclude = super().should_exclude_span
+            mask = [excluded or regex_exclude(line, 0, len(line)) for excluded, line in zip(mask, lines)]
+        return mask
+
+    def should_exclude_span(self, buffer, start: int, end: int) -> bool:
         """
-        패턴 파일 이름에서 패턴 코드를 추출
-        
+        버퍼의 [start, end) 구간(줄바꿈 문자 제외)이 제외되어야 하는지 확인
+
         Args:
-            pattern_file: 패턴 파일 경로
-            
+            buffer: 로그 데이터가 담긴 바이트 버퍼 (bytes 또는 mmap)
+            start: 라인 시작 위치
+            end: 라인 끝 위치 (줄바꿈 문자 위치)
+
         Returns:
-            str: 추출된 패턴 코드 또는 'default'
+            bool: 구간이 어떤 패턴과도 매칭되면 True(제외), 아니면 False(포함)
         """
-        base = os.path.basename(pattern_file)
-        if base == "patterns.json":
-            return "default"
+        return self.exclude_batch([buffer[start:end]])[0]
+
+    def span_matcher(self) -> Callable:
+        """
+        라인 검사 루프에서 사용할 검사 함수를 반환
+
+        Returns:
+            Callable: Arrow 결합 패턴을 포함해 검사하는 should_exclude_span
+        """
+        return self.should_exclude_span
+
+    def batch_matcher(self) -> Optional[Callable]:
+        """
+        여러 라인을 한 번에 검사하는 함수를 반환
+
+        Returns:
+            Optional[Callable]: Arrow 결합 패턴이 있으면 exclude_batch, 없으면 None
+        """
+        if self.arrow_pattern is None:
+            return None
+        return self.exclude_batch
+
+
+def create_log_filter(module_name: str, pattern_file: str) -> LogFilter:
+    """
+    사용 가능한 매칭 엔진에 맞는 로그 필터를 생성
+
+    Args:
+        module_name: 모듈 이름 (패턴 파일의 키)
+        pattern_file: JSON 패턴 파일 경로
+
+    Returns:
+        LogFilter: pyarrow가 설치되어 있으면 ArrowFilter, hyperscan이 설치되어 있으면
+                   HyperscanFilter, 모두 없으면 LogFilter
+    """
+    if pyarrow is not None:
+        return ArrowFilter(module_name, pattern_file)
+    if hyperscan is not None:
+        return HyperscanFilter(module_name, pattern_file)
+    return LogFilter(module_name, pattern_file)
+
+
+def _count_newlines(buffer, start: int, end: int) -> int:
+    """
+    버퍼의 [start, end) 구간에 있는 줄바꿈 수를 계산
+
+    mmap을 슬라이싱하면 구간이 복사되므로, 큰 구간도 WRITE_CHUNK_SIZE 단위로
+    나누어 한 번에 복사되는 크기를 제한합니다.
+
+    Args:
+        buffer: 입력 로그 데이터 (bytes 또는 mmap)
+        start: 시작 위치
+        end: 끝 위치
+
+    Returns:
+        int: 줄바꿈 수
+    """
+    count = 0
+    for pos in range(start, end, WRITE_CHUNK_SIZE):
+        count += buffer[pos:min(pos + WRITE_CHUNK_SIZE, end)].count(b"\n")
+    return count
+
+
+def _write_runs(buffer, runs: List[Tuple[int, int]], writelines: Callable) -> None:
+    """
+    버퍼의 구간들을 복사하지 않고 memoryview 조각으로 기록
+
+    조각이 남아 있으면 mmap을 닫을 수 없으므로 기록에 실패해도 모두 해제합니다.
+
+    Args:
+        buffer: 입력 로그 데이터 (bytes 또는 mmap)
+        runs: 기록할 (시작 위치, 끝 위치) 구간 목록
+        writelines: 바이트 조각 목록을 기록하는 함수
+    """
+    with memoryview(buffer) as view:
+        chunks = [view[run_start:run_end] for run_start, run_end in runs]
+        try:
+            writelines(chunks)
+        finally:
+            for chunk in chunks:
+                chunk.release()
+
+
+def _scan_batches(
+    buffer, start: int, end: int, exclude_batch: Callable, fout, exclude_text: Optional[Callable] = None
+) -> int:
+    """
+    버퍼의 [start, end) 구간을 BATCH_CHUNK_SIZE 단위의 라인 묶음으로 나누어 검사하고
+    포함할 라인만 fout에 기록
+
+    라인 분할과 결과 조합은 bytes.split/join으로 C 수준에서 처리하며, 검사는 묶음마다
+    exclude_batch를 한 번만 호출합니다. CRLF 줄바꿈의 "\r"은 매칭 대상에서 제외합니다.
+    exclude_text가 주어지면 _ASCII_UNSAFE_BYTES가 있는 라인은 exclude_text의 결과를
+    사용합니다.
+
+    Args:
+        buffer: 입력 로그 데이터 (bytes 또는 mmap)
+        start: 검사 시작 위치 (라인 시작 위치)
+        end: 검사 끝 위치 (라인 끝 다음 위치 또는 버퍼 끝)
+        exclude_batch: 라인 목록을 받아 라인별 제외 여부 목록을 반환하는 함수
+        fout: 바이너리 writelines()를 제공하는 출력 대상
+        exclude_text: _ASCII_UNSAFE_BYTES가 있는 라인 목록을 검사하는 함수 (기본: 없음)
+
+    Returns:
+        int: 필터링되지 않은(포함된) 라인 수
+    """
+    find = buffer.find
+    writelines = fout.writelines
+    
+    included_lines = 0
+    pos = start
+    while pos < end:
+        batch_end = end
+        if end - pos > BATCH_CHUNK_SIZE:
+            batch_end = find(b"\n", pos + BATCH_CHUNK_SIZE, end) + 1 or end
+        chunk = buffer[pos:batch_end]
+        pos = batch_end
         
-        m = re.match(r"patterns_(.+)\.json$", base)
-        return m.group(1) if m else os.path.splitext(base)[0]
+        lines = chunk.split(b"\n")
+        terminated = not lines[-1]
+        if terminated:
+            lines.pop()
+        targets = lines
+        if b"\r" in chunk:
+            targets = chunk.replace(b"\r\n", b"\n").split(b"\n")
+            if terminated:
+                targets.pop()
+            elif targets[-1].endswith(b"\r"):
+                targets[-1] = targets[-1][:-1]
+                
+        excluded = exclude_batch(targets)
+        if exclude_text is not None and _ASCII_UNSAFE_BYTES.search(chunk) is not None:
+            if _ASCII_CONTROL_BYTES.search(chunk) is None:
+                # 정규표현식 검색보다 빠른 isascii로 ASCII가 아닌 문자가 있는 라인을 찾음
+                unsafe = [i for i, is_ascii in enumerate(map(bytes.isascii, targets)) if not is_ascii]
+            else:
+                unsafe = [i for i, line in enumerate(targets) if _ASCII_UNSAFE_BYTES.search(line) is not None]
+            for i, text_excluded in zip(unsafe, exclude_text([targets[i] for i in unsafe])):
+                excluded[i] = text_excluded
+        kept = list(compress(lines, map(not_, excluded)))
+        if kept:
+            included_lines += len(kept)
+            # 줄바꿈 없이 끝나는 마지막 라인이 포함된 경우가 아니면 줄바꿈으로 끝남
+            writelines((b"\n".join(kept), b"\n" if terminated or excluded[-1] else b""))
+                
+    return included_lines
 
 
-class LogFilter:
+def _scan_matches(
+    buffer,
+    start: int,
+    end: int,
+    search: Callable,
+    should_exclude_span: Callable,
+    fout,
+    exclude_text: Optional[Callable] = None,
+) -> int:
     """
-    정규표현식 패턴을 기반으로 로그 라인을 필터링하는 클래스
+    버퍼의 [start, end) 구간 전체를 결합 패턴으로 검색하여 매칭된 라인만 제외하고 기록
+
+    라인마다 검사하지 않고 매칭이 있을 때만 Python 코드가 실행되므로, 제외되는
+    라인이 적을수록 빠릅니다. 매칭이 줄바꿈을 넘어가면 매칭이 시작된 라인만 다시
+    검사합니다. 줄바꿈이 LF일 때만 라인 단위 검사와 결과가 같으므로 "\r"이 없는
+    구간에만 사용합니다. exclude_text가 주어지면 _ASCII_UNSAFE_BYTES가 있는 라인은
+    매칭 여부와 관계없이 exclude_text로 검사합니다.
+
+    Args:
+        buffer: 입력 로그 데이터 (bytes 또는 mmap)
+        start: 검사 시작 위치 (라인 시작 위치)
+        end: 검사 끝 위치 (라인 끝 다음 위치 또는 버퍼 끝)
+        search: (buffer, pos, endpos)를 받아 매칭 객체를 반환하는 함수
+        should_exclude_span: 한 라인 구간의 제외 여부를 확인하는 함수
+        fout: 바이너리 writelines()를 제공하는 출력 대상
+        exclude_text: _ASCII_UNSAFE_BYTES가 있는 라인 구간을 검사하는 함수 (기본: 없음)
+
+    Returns:
+        int: 필터링되지 않은(포함된) 라인 수
+    """
+    find = buffer.find
+    rfind = buffer.rfind
+    writelines = fout.writelines
+    
+    included_lines = 0
+    pos = start
+    run_start = start
+    pending = []
+    pending_start = start
+    match = None
+    match_start = -1
+    unsafe_at = end if exclude_text is None else -1
+    
+    while pos < end:
+        if match_start < pos:
+            match = search(buffer, pos, end)
+            match_start = end if match is None else match.start()
+        if unsafe_at < pos:
+            unsafe = _ASCII_UNSAFE_BYTES.search(buffer, pos, end)
+            unsafe_at = end if unsafe is None else unsafe.start()
+        # 다음 매칭과 exclude_text로 검사할 다음 라인 중 앞의 것을 처리
+        at = min(match_start, unsafe_at)
+        if at >= end:
+            break
+            
+        line_start = rfind(b"\n", pos, at) + 1 or pos
+        newline = find(b"\n", at, end)
+        if newline == -1:
+            line_end = next_pos = end
+        else:
+            line_end = newline
+            next_pos = newline + 1
+        pos = next_pos
+        
+        if unsafe_at < line_end:
+            if not exclude_text(buffer, line_start, line_end):
+                continue
+        elif match.end() > line_end and not should_exclude_span(buffer, line_start, line_end):
+            continue
+            
+        # 직전까지 연속으로 포함된 라인 구간을 모아둠
+        if run_start < line_start:
+            if not pending:
+                pending_start = run_start
+            included_lines += _count_newlines(buffer, run_start, line_start)
+            pending.append((run_start, line_start))
+            if line_start - pending_start >= WRITE_CHUNK_SIZE:
+                _write_runs(buffer, pending, writelines)
+                pending = []
+        run_start = next_pos
+        
+    if run_start < end:
+        included_lines += _count_newlines(buffer, run_start, end)
+        if buffer[end - 1] != 0x0A:
+            included_lines += 1
+        pending.append((run_start, end))
+    if pending:
+        _write_runs(buffer, pending, writelines)
+        
+    return included_lines
+
+
+def _scan_and_emit(buffer, start: int, end: int, log_filter: LogFilter, fout) -> int:
     """
+    버퍼의 [start, end) 구간을 라인 단위로 검사하여 포함할 라인만 fout에 기록
 
-    def __init__(self, module_name: str, pattern_file: str):
-        """
-        로그 필터 초기화
+    라인마다 문자열 객체를 만들지 않고 줄바꿈 위치로 구간만 계산해 검사하며,
+    포함할 라인만 원본 바이트 그대로 기록합니다. CRLF 줄바꿈의 "\\r"은
+    매칭 대상에서 제외합니다. 연속으로 포함되는 라인은 하나의 구간으로 묶고,
+    구간들을 복사하지 않고 memoryview 조각으로 WRITE_CHUNK_SIZE 단위로 모아
+    writelines로 한 번에 기록합니다. fout이 _GatherWriter이면 구간들이 os.writev 한 번으로 기록됩니다.
+
+    로그 필터가 라인 묶음 검사를 지원하면 _scan_batches로, 버퍼 전체 검색을
+    지원하고 구간에 "\r"이 없으면 _scan_matches로 처리합니다.
+
+    로그 필터가 ascii_filter()를 제공하면 _ASCII_UNSAFE_BYTES가 없는 라인은 그 로그
+    필터로 검사하고, 있는 라인만 원래 로그 필터로 검사합니다.
+
+    로그 필터가 리터럴 사전 필터를 제공하면, 다음 리터럴 출현 위치 이전의
+    라인들은 패턴 검사 없이 한 번에 포함합니다. 모든 패턴이 단순 리터럴이면
+    리터럴이 나타난 라인도 검사 없이 제외합니다. 라인 시작 리터럴이 섞여 있으면
+    라인 시작에서 리터럴이 나타난 경우에만 검사를 생략합니다.
+
+    라인마다 실행되는 루프이므로 자주 쓰는 메서드는 지역 변수에 바인딩해 두고
+    속성 조회 없이 호출합니다.
+
+    Args:
+        buffer: 입력 로그 데이터 (bytes 또는 mmap)
+        start: 검사 시작 위치 (라인 시작 위치)
+        end: 검사 끝 위치 (라인 끝 다음 위치 또는 버퍼 끝)
+        log_filter: 사용할 LogFilter 인스턴스
+        fout: 바이너리 writelines()를 제공하는 출력 대상
+
+    Returns:
+        int: 필터링되지 않은(포함된) 라인 수
+    """
+    text_filter = None
+    ascii_filter = log_filter.ascii_filter()
+    if ascii_filter is not None:
+        text_filter, log_filter = log_filter, ascii_filter
         
-        Args:
-            module_name: 모듈 이름 (패턴 파일의 키)
-            pattern_file: JSON 패턴 파일 경로
+    exclude_batch = log_filter.batch_matcher()
+    if exclude_batch is not None:
+        exclude_text = None if text_filter is None else text_filter.exclude_batch
+        return _scan_batches(buffer, start, end, exclude_batch, fout, exclude_text)
+        
+    exclude_text = None if text_filter is None else text_filter.should_exclude_span
+    search = log_filter.buffer_matcher()
+    if search is not None and buffer.find(b"\r", start, end) == -1:
+        return _scan_matches(buffer, start, end, search, log_filter.should_exclude_span, fout, exclude_text)
+        
+    find = buffer.find
+    rfind = buffer.rfind
+    writelines = fout.writelines
+    matches = log_filter.span_matcher()
+    should_exclude_span = log_filter.should_exclude_span
+    scanner = log_filter.literal_scanner(buffer, end)
+    literal_only = scanner is not None and bool(log_filter.literal_substrings or log_filter.literal_prefixes)
+    hit_excludes = literal_only and not log_filter.literal_prefixes
+    
+    included_lines = 0
+    pos = start
+    run_start = start
+    pending = []
+    pending_start = start
+    unsafe_at = end if exclude_text is None else -1
+    
+    while pos < end:
+        if scanner is not None:
+            # 리터럴이 나타나는 라인 직전까지는 패턴과 매칭될 수 없으므로 건너뜀
+            candidate = scanner.next_candidate(pos)
+            skip_to = end if candidate == -1 else rfind(b"\n", pos, candidate) + 1
+            if skip_to > pos:
+                included_lines += _count_newlines(buffer, pos, skip_to)
+                if buffer[skip_to - 1] != 0x0A:
+                    included_lines += 1
+                pos = skip_to
+                continue
+                
+        newline = find(b"\n", pos, end)
+        if newline == -1:
+            line_end = next_pos = end
+        else:
+            line_end = newline
+            next_pos = newline + 1
+            
+        if unsafe_at < pos:
+            unsafe = _ASCII_UNSAFE_BYTES.search(buffer, pos, end)
+            unsafe_at = end if unsafe is None else unsafe.start()
+            
+        if literal_only and (hit_excludes or candidate == pos):
+            excluded = True
+        elif unsafe_at < line_end:
+            text_end = line_end - 1 if line_end > pos and buffer[line_end - 1] == 0x0D else line_end
+            excluded = exclude_text(buffer, pos, text_end)
+        elif line_end > pos and buffer[line_end - 1] == 0x0D:
+            excluded = should_exclude_span(buffer, pos, line_end - 1)
+        else:
+            excluded = matches(buffer, pos, line_end)
+            
+        if excluded:
+            # 직전까지 연속으로 포함된 라인 구간을 모아둠
+            if run_start < pos:
+                if not pending:
+                    pending_start = run_start
+                pending.append((run_start, pos))
+                # 모아둔 구간들이 걸친 범위로 크기를 가늠해 기록
+                if pos - pending_start >= WRITE_CHUNK_SIZE:
+                    _write_runs(buffer, pending, writelines)
+                    pending = []
+            run_start = next_pos
+        else:
+            included_lines += 1
+        pos = next_pos
+        
+    if run_start < end:
+        pending.append((run_start, end))
+    if pending:
+        _write_runs(buffer, pending, writelines)
+        
+    return included_lines
+
+
+class _GatherWriter:
+    """
+    여러 조각을 os.writev로 한 번에 기록하는 출력 대상
+
+    조각들을 사용자 공간 버퍼에 복사하지 않고 커널에 분산-수집(scatter-gather)
+    목록으로 전달합니다. 버퍼링 없이 열린 파일의 디스크립터와 함께 사용합니다.
+    """
+
+    def __init__(self, fd: int):
         """
-        self.module_name = module_name
-        self.pattern_manager = PatternManager(pattern_file)
-        self.patterns: List[Pattern] = []
-        self._compile_patterns()
+        출력 대상 초기화
 
-    def _compile_patterns(self) -> None:
-        """패턴 관리자에서 패턴을 로드하고 컴파일"""
-        try:
-            raw_patterns = self.pattern_manager.get_module_patterns(self.module_name)
-            self.patterns = [re.compile(p) for p in raw_patterns]
-            logger.info(f"'{self.module_name}' 모듈에 대해 {len(self.patterns)}개의 패턴을 로드했습니다.")
-        except Exception as e:
-            logger.error(f"패턴 컴파일 중 오류 발생: {str(e)}")
-            raise
+        Args:
+            fd: 출력 파일 디스크립터
+        """
+        self.fd = fd
 
-    def should_exclude(self, log_line: str) -> bool:
+    def write(self, data) -> int:
         """
-        로그 라인이 제외되어야 하는지 확인
-        
+        데이터를 모두 기록
+
         Args:
-            log_line: 검사할 로그 라인
-            
+            data: 기록할 바이트 데이터
+
         Returns:
-            bool: 로그 라인이 어떤 패턴과도 매칭되면 True(제외), 아니면 False(포함)
+            int: 기록한 바이트 수
         """
-        for pat in self.patterns:
-            if pat.search(log_line):
-                return True
-        return False
+        self.writelines([data])
+        return len(data)
+
+    def writelines(self, chunks) -> None:
+        """
+        조각들을 순서대로 모두 기록
+
+        WRITEV_MAX_CHUNKS개씩 os.writev로 기록하며, 일부만 기록된 경우 남은
+        부분부터 다시 기록합니다. 남은 부분은 memoryview로 가리키고 기록이 끝나면
+        해제하므로, 조각이 mmap을 가리켜도 mmap을 닫을 때 참조가 남지 않습니다.
+
+        Args:
+            chunks: 기록할 바이트 조각 목록 (bytes 또는 memoryview)
+        """
+        chunks = list(chunks)
+        views = []
+        index = 0
+        try:
+            while index < len(chunks):
+                batch = chunks[index:index + WRITEV_MAX_CHUNKS]
+                written = os.writev(self.fd, batch)
+                for chunk in batch:
+                    if written < len(chunk):
+                        break
+                    written -= len(chunk)
+                    index += 1
+                if written:
+                    views.append(memoryview(chunks[index]))
+                    views.append(views[-1][written:])
+                    chunks[index] = views[-1]
+        finally:
+            for view in reversed(views):
+                view.release()
+
+
+# 병렬 처리 워커 프로세스에서 사용하는 로그 필터
+_worker_filter: Optional[LogFilter] = None
+
+
+def _init_worker(
+    filter_class: type, module_name: str, pattern_file: str, regex_patterns: List[str]
+) -> None:
+    """
+    병렬 처리 워커 프로세스 초기화 (워커마다 로그 필터를 한 번만 생성)
+
+    Args:
+        filter_class: 생성할 로그 필터 클래스
+        module_name: 모듈 이름 (패턴 파일의 키)
+        pattern_file: JSON 패턴 파일 경로
+        regex_patterns: optimize_order()로 정렬된 정규표현식 패턴 순서
+    """
+    global _worker_filter
+    # 패턴 로드 로그가 워커 수만큼 반복 출력되지 않도록 함
+    logger.setLevel(logging.WARNING)
+    _worker_filter = filter_class(module_name, pattern_file)
+    if regex_patterns != _worker_filter._regex_patterns:
+        _worker_filter._build_matchers(regex_patterns)
+
+
+def _filter_chunk(task: Tuple[str, int, int]) -> Tuple[bytes, int]:
+    """
+    입력 파일의 [start, end) 구간을 필터링 (병렬 처리 워커에서 실행)
+
+    Args:
+        task: (입력 파일 경로, 구간 시작 위치, 구간 끝 위치)
+
+    Returns:
+        Tuple[bytes, int]: 포함할 라인들의 바이트와 포함된 라인 수
+    """
+    input_file, start, end = task
+    out = io.BytesIO()
+    with open(input_file, "rb", buffering=0) as fin:
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            included_lines = _scan_and_emit(mm, start, end, _worker_filter, out)
+    return out.getvalue(), included_lines
 
 
 class LogProcessor:
     """로그 파일을 처리하고 필터링하는 클래스"""
     
-    def __init__(self, log_filter: LogFilter):
+    def __init__(self, log_filter: LogFilter, jobs: Optional[int] = None):
         """
         로그 프로세서 초기화
         
         Args:
             log_filter: 사용할 LogFilter 인스턴스
+            jobs: 병렬 처리 프로세스 수 (기본: CPU 수)
         """
         self.log_filter = log_filter
+        self.jobs = jobs or os.cpu_count() or 1
         
     def process_file(self, input_file: str, output_file: str) -> int:
         """
         입력 파일을 처리하고 필터링된 결과를 출력 파일에 저장
+
+        입력 파일이 PARALLEL_CHUNK_SIZE보다 크고 jobs가 2 이상이면, 라인 경계에 맞춰
+        나눈 구간들을 여러 프로세스에서 동시에 필터링한 뒤 순서대로 기록합니다.
         
         Args:
             input_file: 입력 로그 파일 경로
@@ -188,12 +2002,23 @@ class LogProcessor:
         included_lines = 0
         
         try:
-            with open(input_file, "r", encoding="utf-8") as fin:
-                with open(output_file, "a", encoding="utf-8") as fout:
-                    for line in fin:
-                        if not self.log_filter.should_exclude(line):
-                            fout.write(line)
-                            included_lines += 1
+            # 입력은 mmap으로만 읽으므로 버퍼가 필요 없음
+            # os.writev를 지원하면 출력도 버퍼 없이 열고 조각들을 한 번에 기록
+            gather = hasattr(os, "writev")
+            with open(input_file, "rb", buffering=0) as fin:
+                with open(output_file, "ab", buffering=0 if gather else IO_BUFFER_SIZE) as fout:
+                    if gather:
+                        fout = _GatherWriter(fout.fileno())
+                    # 빈 파일은 mmap으로 매핑할 수 없음
+                    if os.fstat(fin.fileno()).st_size > 0:
+                        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            self._advise_sequential(fin.fileno(), mm)
+                            self.log_filter.optimize_order(mm)
+                            chunks = self._split_chunks(mm)
+                            if self.jobs > 1 and len(chunks) > 1:
+                                included_lines = self._process_parallel(input_file, chunks, fout)
+                            else:
+                                included_lines = _scan_and_emit(mm, 0, len(mm), self.log_filter, fout)
                             
             logger.info(f"총 {included_lines}개의 라인이 필터링되지 않고 포함되었습니다.")
             return included_lines
@@ -205,19 +2030,97 @@ class LogProcessor:
             logger.error(f"파일 처리 중 오류 발생: {str(e)}")
             raise
 
+    @staticmethod
+    def _split_chunks(buffer) -> List[Tuple[int, int]]:
+        """
+        버퍼를 PARALLEL_CHUNK_SIZE 단위의 라인 경계에 맞춘 구간으로 나눔
+
+        Args:
+            buffer: 입력 로그 데이터 (mmap)
+
+        Returns:
+            List[Tuple[int, int]]: (시작 위치, 끝 위치) 구간 목록
+        """
+        size = len(buffer)
+        chunks = []
+        start = 0
+        while start < size:
+            newline = buffer.find(b"\n", start + PARALLEL_CHUNK_SIZE)
+            end = size if newline == -1 else newline + 1
+            chunks.append((start, end))
+            start = end
+        return chunks
+
+    def _process_parallel(self, input_file: str, chunks: List[Tuple[int, int]], fout) -> int:
+        """
+        구간들을 여러 프로세스에서 필터링하고 결과를 순서대로 기록
+
+        Args:
+            input_file: 입력 로그 파일 경로
+            chunks: (시작 위치, 끝 위치) 구간 목록
+            fout: 바이너리 write()를 제공하는 출력 대상
+
+        Returns:
+            int: 필터링되지 않은(포함된) 라인 수
+        """
+        included_lines = 0
+        initargs = (
+            type(self.log_filter),
+            self.log_filter.module_name,
+            self.log_filter.pattern_manager.pattern_file,
+            self.log_filter._regex_patterns,
+        )
+        tasks = [(input_file, start, end) for start, end in chunks]
+        
+        logger.debug(f"{len(chunks)}개 구간을 {min(self.jobs, len(chunks))}개 프로세스로 처리합니다.")
+        with multiprocessing.Pool(min(self.jobs, len(chunks)), _init_worker, initargs) as pool:
+            for data, count in pool.imap(_filter_chunk, tasks):
+                fout.write(data)
+                included_lines += count
+                
+        return included_lines
+
+    @staticmethod
+    def _advise_sequential(fd: int, mm: mmap.mmap) -> None:
+        """
+        입력 파일을 순차적으로 읽는다는 것을 커널에 알림
+
+        커널이 미리 읽기(readahead)를 적극적으로 수행하여 디스크 읽기와 패턴 검사가
+        겹쳐서 진행되도록 합니다. 지원하지 않는 플랫폼에서는 아무 작업도 하지 않습니다.
+
+        Args:
+            fd: 입력 파일 디스크립터
+            mm: 입력 파일을 매핑한 mmap 객체
+        """
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+        except OSError as e:
+            logger.debug(f"미리 읽기 힌트 설정 실패: {str(e)}")
+
 
 class PathResolver:
     """파일 경로를 해석하고 생성하는 클래스"""
     
-    def __init__(self, base_dir: str):
+    def __init__(self, base_dir: str, now: Optional[datetime] = None):
         """
         경로 해석기 초기화
         
+        출력 경로에 사용할 날짜는 생성 시점에 한 번만 계산합니다.
+        
         Args:
             base_dir: 기본 디렉토리 경로
+            now: 출력 경로 생성 기준 시각 (기본: 현재 시각)
         """
         self.base_dir = base_dir
         
+        # 날짜 문자열을 한 번만 포맷하고 연/월은 잘라서 사용
+        self.ymd = (now or datetime.now()).strftime("%Y%m%d")
+        self.year = self.ymd[:4]
+        self.month = self.ymd[4:6]
+        
     def resolve_input_path(self, input_file: Optional[str], module_name: str) -> str:
         """
         입력 파일 경로 해석
@@ -261,20 +2164,15 @@ class PathResolver:
                 return output_file
             return os.path.join(self.base_dir, output_file)
             
-        # 현재 날짜 기준으로 경로 생성
-        now = datetime.now()
-        year = now.strftime("%Y")
-        month = now.strftime("%m")
-        ymd = now.strftime("%Y%m%d")
-        
+        # 경로 해석기 생성 시점의 날짜 기준으로 경로 생성
         return os.path.join(
             self.base_dir,
             "result",
             pattern_code,
             module_name,
-            year,
-            month,
-            f"{module_name}_{ymd}.log",
+            self.year,
+            self.month,
+            f"{module_name}_{self.ymd}.log",
         )
 
 
@@ -310,6 +2208,17 @@ def parse_arguments():
         default=os.path.join(base_dir, "patterns.json"),
         help="필터링 패턴 JSON 파일 경로 (기본: patterns.json)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="병렬 처리 프로세스 수 (기본: CPU 수, 큰 파일에만 적용)",
+    )
+    parser.add_argument(
+        "--compile-patterns",
+        action="store_true",
+        help="Hyperscan 데이터베이스를 <패턴 파일 이름>.<모듈명>.hsdb로 컴파일해 저장하고 종료",
+    )
     parser.add_argument(
         "--verbose", 
         action="store_true", 
@@ -331,6 +2240,15 @@ def main():
     base_dir = os.path.dirname(os.path.abspath(__file__))
     
     try:
+        # 패턴 데이터베이스만 컴파일해 저장
+        if args.compile_patterns:
+            if hyperscan is None:
+                logger.error("hyperscan이 설치되어 있지 않아 패턴 데이터베이스를 컴파일할 수 없습니다.")
+                sys.exit(1)
+            database_path = HyperscanFilter(args.module, args.pattern_file).save_database()
+            logger.info(f"✅ 패턴 데이터베이스를 '{database_path}'에 저장했습니다.")
+            return
+            
         # 패턴 코드 추출
         pattern_code = PatternManager.extract_pattern_code(args.pattern_file)
         
@@ -348,10 +2266,10 @@ def main():
         logger.debug(f"패턴 파일: {args.pattern_file}")
         
         # 로그 필터 생성
-        log_filter = LogFilter(args.module, args.pattern_file)
+        log_filter = create_log_filter(args.module, args.pattern_file)
         
         # 로그 프로세서 생성 및 실행
-        processor = LogProcessor(log_filter)
+        processor = LogProcessor(log_filter, args.jobs)
         included_lines = processor.process_file(input_path, output_path)
         
         logger.info(f"✅ 필터링 결과를 '{output_path}'에 저장했습니다. ({included_lines}개 라인 포함)")
@@ -4,53 +4,186 @@
 테스트 모듈: log_filter.py의 기능을 테스트합니다.
 """
 
+import io
 import json
 import os
+import re
 import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+from unittest import mock
 
-from log_filter import LogFilter, PatternManager, LogProcessor, PathResolver
+import log_filter as log_filter_module
+from log_filter import (
+    ArrowFilter,
+    HyperscanFilter,
+    LogFilter,
+    LogProcessor,
+    PathResolver,
+    PatternManager,
+    _GatherWriter,
+    _extract_literal,
+    _is_line_local,
+    _literal_pattern,
+    _scan_and_emit,
+    _scan_matches,
+    create_log_filter,
+)
 
 
-class TestPatternManager(unittest.TestCase):
-    """PatternManager 클래스 테스트"""
-    
+class PatternFileTestCase(unittest.TestCase):
+    """임시 패턴 파일을 사용하는 테스트의 공통 설정"""
+
+    # setUp에서 "test_module" 모듈의 패턴으로 작성할 패턴 목록
+    patterns: List[str] = []
+
     def setUp(self):
         """테스트 설정"""
         # 임시 패턴 파일 생성
         self.temp_dir = tempfile.TemporaryDirectory()
         self.pattern_file = os.path.join(self.temp_dir.name, "test_patterns.json")
-        
-        # 테스트 패턴 데이터
-        self.pattern_data = {
-            "test_module": {
-                "patterns": [
-                    "pattern1",
-                    "pattern2"
-                ]
-            }
-        }
-        
-        # 패턴 파일 작성
-        with open(self.pattern_file, "w", encoding="utf-8") as f:
-            json.dump(self.pattern_data, f)
-    
+        self.pattern_data = {}
+        self._write_patterns("test_module", self.patterns)
+
     def tearDown(self):
         """테스트 정리"""
         self.temp_dir.cleanup()
+
+    def _write_patterns(self, module_name: str, patterns: List[str]) -> None:
+        """
+        모듈의 패턴 목록을 설정하고 패턴 파일을 다시 작성
+
+        Args:
+            module_name: 모듈 이름 (패턴 파일의 키)
+            patterns: 정규표현식 패턴 목록
+        """
+        self.pattern_data[module_name] = {"patterns": list(patterns)}
+        with open(self.pattern_file, "w", encoding="utf-8") as f:
+            json.dump(self.pattern_data, f)
+
+
+class FakeScanTerminated(Exception):
+    """hyperscan.ScanTerminated 대체 예외"""
+
+
+class FakeDatabase:
+    """
+    re 모듈로 매칭하는 hyperscan.Database 대체 객체
+
+    MULTILINE 데이터베이스는 라인마다 매칭을 찾으므로 줄바꿈을 넘는 매칭은 보고하지
+    않습니다. 이런 매칭은 HyperscanFilter가 라인 단위로 다시 검사해 제외하지 않습니다.
+    """
+
+    def __init__(self, raw_patterns, multiline):
+        self.multiline = multiline
+        self.regexes = [re.compile(p.encode("utf-8")) for p in raw_patterns]
+
+    def scan(self, data, match_event_handler, flags=0, context=None):
+        # 실제 Hyperscan처럼 패턴마다 첫 매칭만 끝 위치 순서로 보고
+        ends = {}
+        offset = 0
+        for line in bytes(data).split(b"\n") if self.multiline else [bytes(data)]:
+            for expr_id, regex in enumerate(self.regexes):
+                match = None if expr_id in ends else regex.search(line)
+                if match:
+                    ends[expr_id] = offset + match.end()
+            offset += len(line) + 1
+        for expr_id, to in sorted(ends.items(), key=lambda item: (item[1], item[0])):
+            if match_event_handler(expr_id, 0, to, 0, context):
+                raise FakeScanTerminated()
+
+
+def fake_build_database(raw_patterns, multiline=False):
+    """전후방탐색이 있는 패턴은 실제 Hyperscan처럼 지원하지 않는 HyperscanFilter._build_database 대체 함수"""
+    if any(look in p for p in raw_patterns for look in ("(?=", "(?!", "(?<=", "(?<!")):
+        return None
+    return FakeDatabase(raw_patterns, multiline)
+
+
+def fake_match_substring_regex(lines, pattern):
+    """전후방탐색이 있는 패턴은 실제 RE2처럼 지원하지 않는 pyarrow.compute.match_substring_regex 대체 함수"""
+    if any(look in pattern for look in ("(?=", "(?!", "(?<=", "(?<!")):
+        raise ValueError(f"Invalid regular expression: {pattern}")
+    regex = re.compile(pattern.encode("utf-8"))
+    return SimpleNamespace(to_pylist=lambda: [regex.search(line) is not None for line in lines])
+
+
+def patch_fake_hyperscan(test_case: unittest.TestCase) -> None:
+    """테스트 동안 hyperscan 대신 re 모듈 기반 대체 객체를 사용"""
+    fake_hyperscan = SimpleNamespace(ScanTerminated=FakeScanTerminated, error=Exception)
+    for patcher in (
+        mock.patch.object(log_filter_module, "hyperscan", fake_hyperscan),
+        mock.patch.object(HyperscanFilter, "_build_database", staticmethod(fake_build_database)),
+    ):
+        patcher.start()
+        test_case.addCleanup(patcher.stop)
+
+
+def patch_fake_pyarrow(test_case: unittest.TestCase) -> None:
+    """테스트 동안 pyarrow 대신 re 모듈 기반 대체 객체를 사용"""
+    fake_pyarrow = SimpleNamespace(
+        array=lambda lines, _type: list(lines), binary=lambda: None, ArrowInvalid=ValueError
+    )
+    fake_compute = SimpleNamespace(match_substring_regex=fake_match_substring_regex)
+    for patcher in (
+        mock.patch.object(log_filter_module, "pyarrow", fake_pyarrow),
+        mock.patch.object(log_filter_module, "pyarrow_compute", fake_compute, create=True),
+    ):
+        patcher.start()
+        test_case.addCleanup(patcher.stop)
+    # 지원 여부 캐시가 실제 pyarrow 테스트와 섞이지 않도록 비움
+    ArrowFilter._arrow_supports.cache_clear()
+    test_case.addCleanup(ArrowFilter._arrow_supports.cache_clear)
+
+
+class TestPatternManager(PatternFileTestCase):
+    """PatternManager 클래스 테스트"""
+
+    patterns = ["pattern1", "pattern2"]
     
     def test_load_pattern_file(self):
         """패턴 파일 로드 테스트"""
         manager = PatternManager(self.pattern_file)
         self.assertEqual(manager.patterns_data, self.pattern_data)
     
+    def test_load_pattern_file_cache(self):
+        """패턴 파일 캐시 테스트"""
+        manager1 = PatternManager(self.pattern_file)
+        with mock.patch.object(log_filter_module, "_json_loads") as json_loads:
+            manager2 = PatternManager(self.pattern_file)
+        json_loads.assert_not_called()
+        self.assertEqual(manager1.patterns_data, manager2.patterns_data)
+
+        # 캐시된 데이터를 공유하지 않으므로 반환된 패턴 목록을 수정해도 다른 관리자에 영향이 없음
+        manager1.get_module_patterns("test_module").append("pattern3")
+        manager1.patterns_data["test_module"]["patterns"].append("pattern3")
+        self.assertEqual(manager2.get_module_patterns("test_module"), ["pattern1", "pattern2"])
+        self.assertEqual(PatternManager(self.pattern_file).get_module_patterns("test_module"), ["pattern1", "pattern2"])
+
+        # 파일이 수정되면 다시 로드
+        self._write_patterns("test_module", ["pattern1", "pattern2", "pattern3"])
+        stat = os.stat(self.pattern_file)
+        os.utime(self.pattern_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        manager3 = PatternManager(self.pattern_file)
+        self.assertEqual(manager3.get_module_patterns("test_module"), ["pattern1", "pattern2", "pattern3"])
+
     def test_get_module_patterns(self):
         """모듈 패턴 가져오기 테스트"""
         manager = PatternManager(self.pattern_file)
         patterns = manager.get_module_patterns("test_module")
         self.assertEqual(patterns, ["pattern1", "pattern2"])
     
+    def test_invalid_pattern_file(self):
+        """잘못된 형식의 패턴 파일 테스트"""
+        with open(self.pattern_file, "w", encoding="utf-8") as f:
+            f.write('{"test_module": {"patterns": [')
+        with self.assertRaises(json.JSONDecodeError):
+            PatternManager(self.pattern_file)
+
     def test_module_not_found(self):
         """존재하지 않는 모듈 테스트"""
         manager = PatternManager(self.pattern_file)
@@ -72,70 +205,577 @@ class TestPatternManager(unittest.TestCase):
         self.assertEqual(code, "custom_patterns")
 
 
-class TestLogFilter(unittest.TestCase):
+class TestLogFilter(PatternFileTestCase):
     """LogFilter 클래스 테스트"""
+
+    patterns = ["^DEBUG:", "^INFO: heartbeat$", "\\d{3}-\\d{4}-\\d{4}"]
     
     def setUp(self):
         """테스트 설정"""
-        # 임시 패턴 파일 생성
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.pattern_file = os.path.join(self.temp_dir.name, "test_patterns.json")
-        
-        # 테스트 패턴 데이터
-        self.pattern_data = {
-            "test_module": {
-                "patterns": [
-                    "^DEBUG:",
-                    "^INFO: heartbeat$",
-                    "\\d{3}-\\d{4}-\\d{4}"
-                ]
-            }
-        }
-        
-        # 패턴 파일 작성
-        with open(self.pattern_file, "w", encoding="utf-8") as f:
-            json.dump(self.pattern_data, f)
-            
+        super().setUp()
         # LogFilter 인스턴스 생성
         self.log_filter = LogFilter("test_module", self.pattern_file)
     
-    def tearDown(self):
-        """테스트 정리"""
-        self.temp_dir.cleanup()
-    
     def test_should_exclude(self):
         """로그 라인 제외 여부 테스트"""
         # 제외되어야 하는 라인
-        self.assertTrue(self.log_filter.should_exclude("DEBUG: test message"))
-        self.assertTrue(self.log_filter.should_exclude("INFO: heartbeat"))
-        self.assertTrue(self.log_filter.should_exclude("Contact: 010-1234-5678"))
+        self.assertTrue(self.log_filter.should_exclude(b"DEBUG: test message"))
+        self.assertTrue(self.log_filter.should_exclude(b"INFO: heartbeat"))
+        self.assertTrue(self.log_filter.should_exclude(b"Contact: 010-1234-5678"))
         
         # 포함되어야 하는 라인
-        self.assertFalse(self.log_filter.should_exclude("ERROR: test message"))
-        self.assertFalse(self.log_filter.should_exclude("INFO: system started"))
-        self.assertFalse(self.log_filter.should_exclude("Normal log line"))
+        self.assertFalse(self.log_filter.should_exclude(b"ERROR: test message"))
+        self.assertFalse(self.log_filter.should_exclude(b"INFO: system started"))
+        self.assertFalse(self.log_filter.should_exclude(b"Normal log line"))
+
+    def test_should_exclude_with_newline(self):
+        """줄바꿈이 포함된 로그 라인 테스트"""
+        self.assertTrue(self.log_filter.should_exclude(b"INFO: heartbeat\n"))
+        self.assertTrue(self.log_filter.should_exclude(b"INFO: heartbeat\r\n"))
+        self.assertFalse(self.log_filter.should_exclude(b"INFO: heartbeat beat\n"))
+
+    def test_should_exclude_invalid_utf8(self):
+        """UTF-8이 아닌 바이트가 포함된 로그 라인 테스트"""
+        self.assertTrue(self.log_filter.should_exclude(b"\xff\xfe Contact: 010-1234-5678"))
+        self.assertFalse(self.log_filter.should_exclude(b"\xff\xfe ERROR: test message"))
+
+    def test_unsupported_re2_syntax(self):
+        """RE2 미지원 문법(전방탐색) 패턴 테스트"""
+        self._write_patterns("lookahead_module", ["^(?=.*\\d)(?=.*[A-Za-z])[A-Za-z0-9]+$"])
+
+        log_filter = LogFilter("lookahead_module", self.pattern_file)
+        self.assertTrue(log_filter.should_exclude(b"abc123"))
+        self.assertFalse(log_filter.should_exclude(b"abcdef"))
+
+    def test_non_ascii_patterns(self):
+        """ASCII가 아닌 문자 클래스와 한 글자 와일드카드 패턴 테스트"""
+        self._write_patterns("text_module", ["^ERROR [가-힣]", "^.{3}$", "처리 완료"])
+
+        log_filter = LogFilter("text_module", self.pattern_file)
+        self.assertEqual(len(log_filter._text_patterns), 2)
+        self.assertTrue(log_filter.should_exclude("ERROR 가".encode("utf-8")))
+        self.assertTrue(log_filter.should_exclude("가나다".encode("utf-8")))
+        self.assertTrue(log_filter.should_exclude("작업 처리 완료".encode("utf-8")))
+        self.assertFalse(log_filter.should_exclude("ERROR é".encode("utf-8")))
+        self.assertFalse(log_filter.should_exclude("가나다라".encode("utf-8")))
+
+        buffer = "ERROR é\n가나다\nabcd\n".encode("utf-8")
+        out = io.BytesIO()
+        included_lines = _scan_and_emit(buffer, 0, len(buffer), log_filter, out)
+        self.assertEqual(included_lines, 2)
+        self.assertEqual(out.getvalue(), "ERROR é\nabcd\n".encode("utf-8"))
+
+    def test_unicode_escape_patterns(self):
+        """바이트 패턴에서 쓸 수 없는 유니코드 이스케이프 패턴 테스트"""
+        self._write_patterns("escape_module", ["^[\\uAC00-\\uD7A3]+$", "\\u0041BC", "\\N{HANGUL SYLLABLE GA}\\d"])
+
+        buffer = "가나다\nxABCx\n가1\n가a\nabc\n".encode("utf-8")
+        for log_filter in (LogFilter("escape_module", self.pattern_file), create_log_filter("escape_module", self.pattern_file)):
+            self.assertEqual(len(log_filter.patterns), 3)
+            self.assertTrue(log_filter.should_exclude("가나다".encode("utf-8")))
+            self.assertTrue(log_filter.should_exclude(b"xABCx"))
+            self.assertFalse(log_filter.should_exclude(b"abc"))
+            
+            log_filter.optimize_order(buffer)
+            out = io.BytesIO()
+            self.assertEqual(_scan_and_emit(buffer, 0, len(buffer), log_filter, out), 2)
+            self.assertEqual(out.getvalue(), "가a\nabc\n".encode("utf-8"))
+
+    def test_unicode_character_classes(self):
+        """문자열 패턴의 "\\w", "\\d", "\\b"가 유니코드 기준으로 동작하는지 테스트"""
+        compile_regex = log_filter_module._compile_regex
+        self.assertIsNotNone(compile_regex("^\\w+$").search("가나다"))
+        self.assertIsNotNone(compile_regex("사용자 \\w+ 로그인").search("사용자 홍길동 로그인"))
+        self.assertIsNotNone(compile_regex("\\b홍길동\\b").search("사용자 홍길동"))
+        self.assertIsNone(compile_regex("(?a)^\\w+$").search("가나다"))
+
+        self._write_patterns("unicode_module", ["^\\w+$", "사용자 \\w+ 로그인", "^\\s*$", "(?a)^\\d+ 건$", "\\bid\\b"])
+
+        excluded = ["가나다", "사용자 홍길동 로그인", "\x1c", "\u3000", "12 건", "가 id", "abc_1"]
+        included = ["가나 다", "١٢ 건", "가id!", "ERROR: x"]
+        buffer = "\n".join(excluded + included).encode("utf-8")
+        for log_filter in (LogFilter("unicode_module", self.pattern_file), create_log_filter("unicode_module", self.pattern_file)):
+            self.assertIsNotNone(log_filter.ascii_filter())
+            for line in excluded:
+                self.assertTrue(log_filter.should_exclude(line.encode("utf-8")), line)
+            for line in included:
+                self.assertFalse(log_filter.should_exclude(line.encode("utf-8")), line)
+                
+            out = io.BytesIO()
+            self.assertEqual(_scan_and_emit(buffer, 0, len(buffer), log_filter, out), len(included))
+            self.assertEqual(out.getvalue(), "\n".join(included).encode("utf-8"))
+
+    def test_extract_literal(self):
+        """필수 리터럴 추출 테스트"""
+        self.assertEqual(_extract_literal("^DEBUG:"), b"DEBUG:")
+        self.assertEqual(_extract_literal("^INFO: heartbeat$"), b"INFO: heartbeat")
+        self.assertEqual(_extract_literal("id=\\d+ 처리 완료"), " 처리 완료".encode("utf-8"))
+        self.assertIsNone(_extract_literal("^\\s*$"))
+        self.assertIsNone(_extract_literal("DEBUG|INFO"))
+        self.assertIsNone(_extract_literal("(?i)debug"))
+
+    def test_literal_pattern(self):
+        """단순 리터럴 패턴 판별 테스트"""
+        self.assertEqual(_literal_pattern("heartbeat"), (b"heartbeat", False))
+        self.assertEqual(_literal_pattern(".*heartbeat.*"), (b"heartbeat", False))
+        self.assertEqual(_literal_pattern("^DEBUG:.*"), (b"DEBUG:", True))
+        self.assertEqual(_literal_pattern("\\[INFO\\]"), (b"[INFO]", False))
+        self.assertIsNone(_literal_pattern("^INFO: heartbeat$"))
+        self.assertIsNone(_literal_pattern("DEBUG|INFO"))
+        self.assertIsNone(_literal_pattern("(?i)debug"))
+
+    def test_literal_fast_path(self):
+        """리터럴 위치만으로 제외 여부를 판단하는 경로 테스트"""
+        self.assertEqual(self.log_filter.literal_substrings, [])
+        self.assertEqual(self.log_filter.literal_prefixes, [])
+
+        self._write_patterns("literal_module", ["heartbeat", "^DEBUG:.*"])
+
+        log_filter = LogFilter("literal_module", self.pattern_file)
+        self.assertEqual(log_filter.literal_substrings, [b"heartbeat"])
+        self.assertEqual(log_filter.literal_prefixes, [b"DEBUG:"])
+
+        buffer = b"DEBUG: a\nINFO: DEBUG: b\nINFO: heartbeat\r\nDEBUG\nINFO: c"
+        output = io.BytesIO()
+        self.assertEqual(_scan_and_emit(buffer, 0, len(buffer), log_filter, output), 3)
+        self.assertEqual(output.getvalue(), b"INFO: DEBUG: b\nDEBUG\nINFO: c")
+
+    def test_is_line_local(self):
+        """버퍼 전체 검색 가능 여부 판별 테스트"""
+        self.assertTrue(_is_line_local("^DEBUG:.*$"))
+        self.assertTrue(_is_line_local("\\d{3}-\\d{4}-\\d{4}"))
+        self.assertFalse(_is_line_local("^(?=.*\\d)[A-Za-z0-9]+$"))
+        self.assertFalse(_is_line_local("(?:a|b(?!c))+"))
+        self.assertFalse(_is_line_local("done\\Z"))
+        self.assertFalse(_is_line_local("\\Astart"))
+        self.assertFalse(_is_line_local("a(?>\\s*)$"))
+        self.assertFalse(_is_line_local("a\\s*+$"))
+
+    def test_atomic_group_pattern(self):
+        """원자 그룹 패턴은 버퍼 전체 검색 없이 라인 단위로 검사하는지 테스트"""
+        self._write_patterns("atomic_module", ["a(?>\\s*)$", "^DEBUG:"])
+        with mock.patch.object(log_filter_module, "_compile_regex", re.compile):
+            log_filter = LogFilter("atomic_module", self.pattern_file)
+        self.assertIsNone(log_filter.buffer_matcher())
+
+        buffer = b"a\n\nINFO: b\n"
+        output = io.BytesIO()
+        self.assertEqual(_scan_and_emit(buffer, 0, len(buffer), log_filter, output), 2)
+        self.assertEqual(output.getvalue(), b"\nINFO: b\n")
+
+    def test_scan_matches(self):
+        """버퍼 전체 검색 경로 테스트"""
+        self._write_patterns("multiline_module", ["^\\s*$", "foo\\s+bar", "^DEBUG:"])
+        log_filter = LogFilter("multiline_module", self.pattern_file)
+
+        # 줄바꿈을 넘어가는 "foo\nbar" 매칭은 라인을 제외하지 않음
+        buffer = b"INFO: foo\nbar\n\nDEBUG: a\nINFO: foo bar\nINFO: end"
+        search = LogFilter._combine(log_filter.raw_patterns).search
+        output = io.BytesIO()
+        included = _scan_matches(buffer, 0, len(buffer), search, log_filter.should_exclude_span, output)
+        self.assertEqual(included, 3)
+        self.assertEqual(output.getvalue(), b"INFO: foo\nbar\nINFO: end")
+
+        output = io.BytesIO()
+        self.assertEqual(_scan_matches(buffer, 0, 14, search, log_filter.should_exclude_span, output), 2)
+        self.assertEqual(output.getvalue(), b"INFO: foo\nbar\n")
+
+        # 전방탐색이 있는 패턴은 라인 단위로 검사
+        with mock.patch.object(log_filter_module, "_compile_regex", re.compile):
+            log_filter = LogFilter("multiline_module", self.pattern_file)
+            self.assertIsNotNone(log_filter.ascii_filter().buffer_matcher())
+        self._write_patterns(
+            "multiline_module", self.pattern_data["multiline_module"]["patterns"] + ["^(?=.*\\d)[a-z0-9]+$"]
+        )
+        with mock.patch.object(log_filter_module, "_compile_regex", re.compile):
+            log_filter = LogFilter("multiline_module", self.pattern_file)
+            self.assertIsNone(log_filter.ascii_filter().buffer_matcher())
+
+        # ASCII가 아닌 문자가 있는 라인은 매칭 여부와 관계없이 exclude_text로 검사
+        log_filter = LogFilter("multiline_module", self.pattern_file)
+        buffer = "가 foo bar\nfoo\u3000bar\n가\nDEBUG: 가\nend".encode("utf-8")
+        output = io.BytesIO()
+        included = _scan_matches(
+            buffer, 0, len(buffer), search, log_filter.ascii_filter().should_exclude_span, output,
+            log_filter.should_exclude_span,
+        )
+        self.assertEqual(included, 2)
+        self.assertEqual(output.getvalue(), "가\nend".encode("utf-8"))
+
+    def test_literal_prefilter(self):
+        """리터럴 사전 필터 테스트"""
+        # "\d{3}-\d{4}-\d{4}" 패턴의 리터럴 "-"는 너무 짧아 사전 필터를 사용하지 않음
+        self.assertIsNone(self.log_filter.literals)
+        self.assertIsNone(self.log_filter.literal_scanner(b""))
+
+        self._write_patterns("literal_module", ["^DEBUG:", "^INFO: heartbeat$"])
+
+        log_filter = LogFilter("literal_module", self.pattern_file)
+        self.assertEqual(log_filter.literals, [b"DEBUG:", b"INFO: heartbeat"])
+
+        buffer = b"ERROR: a\nINFO: heartbeat\nERROR: b\nDEBUG: c\n"
+        scanner = log_filter.literal_scanner(buffer)
+        self.assertEqual(scanner.next_candidate(0), 9)
+        self.assertEqual(scanner.next_candidate(25), 34)
+        self.assertEqual(scanner.next_candidate(43), -1)
+
+        # 건너뛰는 라인들의 줄바꿈은 WRITE_CHUNK_SIZE 단위로 나누어 셈
+        buffer = b"ERROR: a\n" * 10 + b"DEBUG: c\nERROR: d"
+        for chunk_size in (1, 4, 1024):
+            with mock.patch.object(log_filter_module, "WRITE_CHUNK_SIZE", chunk_size):
+                out = io.BytesIO()
+                self.assertEqual(_scan_and_emit(buffer, 0, len(buffer), log_filter, out), 11)
+                self.assertEqual(out.getvalue(), b"ERROR: a\n" * 10 + b"ERROR: d")
+
+    def test_literal_prefilter_hyperscan_patterns(self):
+        """Hyperscan으로 검사하는 패턴도 사전 필터 리터럴에 포함되는지 테스트"""
+        self._write_patterns("hs_module", ["^DEBUG:", "(?<=id=)secret"])
+        patch_fake_hyperscan(self)
+
+        log_filter = HyperscanFilter("hs_module", self.pattern_file)
+        self.assertEqual(log_filter.hyperscan_patterns, ["^DEBUG:"])
+        self.assertCountEqual(log_filter.literals, [b"DEBUG:", b"secret"])
+
+        buffer = b"DEBUG: noisy\nINFO: id=secret\nINFO: ok\n"
+        out = io.BytesIO()
+        included_lines = _scan_and_emit(buffer, 0, len(buffer), log_filter, out)
+
+        self.assertEqual(included_lines, 1)
+        self.assertEqual(out.getvalue(), b"INFO: ok\n")
+
+    @unittest.skipUnless(log_filter_module.ahocorasick, "pyahocorasick이 설치되어 있지 않음")
+    def test_literal_scanner_automaton(self):
+        """Aho-Corasick 리터럴 스캐너 테스트 (구간 경계에 걸친 리터럴 포함)"""
+        literals = [b"DEBUG:", b"heartbeat"]
+        automaton = log_filter_module.ahocorasick.Automaton()
+        for lit in literals:
+            automaton.add_word(lit.decode("latin-1"), lit)
+        automaton.make_automaton()
+
+        buffer = b"ERROR: a\nINFO: heartbeat\nERROR: b\nDEBUG: c\n"
+        scanner = log_filter_module.LiteralScanner(buffer, literals, automaton)
+        scanner.WINDOW_SIZE = 16
+        self.assertEqual(scanner.next_candidate(0), 15)
+        self.assertEqual(scanner.next_candidate(25), 34)
+        self.assertEqual(scanner.next_candidate(43), -1)
+
+    def test_duplicate_patterns(self):
+        """중복 패턴 제거 테스트"""
+        self._write_patterns("dup_module", ["^DEBUG:", "heartbeat", "^DEBUG:"])
+
+        log_filter = LogFilter("dup_module", self.pattern_file)
+        self.assertEqual(log_filter.raw_patterns, ["^DEBUG:", "heartbeat"])
+        self.assertEqual(len(log_filter.patterns), 2)
+
+    def test_optimize_order(self):
+        """패턴 순서 최적화 테스트"""
+        self._write_patterns("order_module", ["^DEBUG:", "heartbeat", "^ERROR:"])
+
+        log_filter = LogFilter("order_module", self.pattern_file)
+        with mock.patch.object(
+            log_filter_module, "_compile_regex", wraps=log_filter_module._compile_regex
+        ) as compile_regex:
+            log_filter.optimize_order(b"ERROR: a\nINFO: heartbeat\nERROR: b\r\nDEBUG: c\nERROR: d\nheartbeat\n")
+        self.assertEqual(log_filter._regex_patterns, ["^ERROR:", "heartbeat", "^DEBUG:"])
+        self.assertTrue(log_filter.should_exclude(b"DEBUG: c"))
+
+        # 샘플 검사도 라인 검사와 같은 엔진(RE2가 있으면 RE2)으로 컴파일
+        compile_regex.assert_any_call(b"(?m)^ERROR:")
+
+        # 병렬 처리 워커에는 정렬된 순서를 전달
+        order = log_filter._regex_patterns
+        with mock.patch.object(log_filter_module, "_worker_filter", None), mock.patch.object(
+            log_filter_module.logger, "setLevel"
+        ):
+            log_filter_module._init_worker(LogFilter, "order_module", self.pattern_file, order)
+            self.assertEqual(log_filter_module._worker_filter._regex_patterns, order)
+
+    def test_combined_pattern(self):
+        """패턴 결합 테스트"""
+        self.assertEqual(len(self.log_filter.patterns), 3)
+        self.assertIsNotNone(self.log_filter.combined)
+
+    def test_empty_patterns(self):
+        """패턴이 없는 모듈 테스트"""
+        self._write_patterns("empty_module", [])
+
+        log_filter = LogFilter("empty_module", self.pattern_file)
+        self.assertIsNone(log_filter.combined)
+        self.assertFalse(log_filter.should_exclude(b"DEBUG: test message"))
 
+    def test_inline_flags(self):
+        """전역 인라인 플래그가 있는 패턴 결합 테스트"""
+        self._write_patterns("flag_module", ["^DEBUG:", "(?i)heartbeat"])
 
-class TestLogProcessor(unittest.TestCase):
+        log_filter = LogFilter("flag_module", self.pattern_file)
+        self.assertTrue(log_filter.should_exclude(b"INFO: HEARTBEAT"))
+        self.assertFalse(log_filter.should_exclude(b"INFO: debug"))
+
+    def test_verbose_inline_flags(self):
+        """주석이 있는 "(?x)" 패턴과 여러 전역 플래그 결합 테스트"""
+        self._write_patterns("flag_module", ["^DEBUG:", "(?x) HEART \\d+ # 주석", "(?i)(?s)beat.end"])
+
+        log_filter = LogFilter("flag_module", self.pattern_file)
+        self.assertTrue(log_filter.should_exclude(b"HEART12"))
+        self.assertTrue(log_filter.should_exclude(b"BEAT-END"))
+        self.assertFalse(log_filter.should_exclude(b"HEART 12"))
+
+    def test_string_start_anchor(self):
+        """"\\A" 앵커가 버퍼 시작이 아닌 각 라인의 시작에서 매칭되는지 테스트"""
+        self._write_patterns("anchor_module", ["\\ADEBUG", "x|\\ATRACE"])
+
+        log_filter = LogFilter("anchor_module", self.pattern_file)
+        buffer = b"DEBUG a\nINFO\nDEBUG b\nTRACE c\nINFO DEBUG\n"
+        out = io.BytesIO()
+        included_lines = _scan_and_emit(buffer, 0, len(buffer), log_filter, out)
+
+        self.assertEqual(included_lines, 2)
+        self.assertEqual(out.getvalue(), b"INFO\nINFO DEBUG\n")
+
+    def test_group_reference_patterns(self):
+        """역참조와 이름 있는 그룹이 있는 패턴은 결합하지 않고 검사하는지 테스트"""
+        self._write_patterns("group_module", ["(a)b", "(x)\\1", "(?P<lvl>DEBUG)", "(?P<lvl>TRACE)"])
+
+        log_filter = LogFilter("group_module", self.pattern_file)
+        self.assertEqual(len(log_filter._line_patterns), 3)
+        self.assertTrue(log_filter.should_exclude(b"ab"))
+        self.assertTrue(log_filter.should_exclude(b"xx"))
+        self.assertTrue(log_filter.should_exclude(b"TRACE: start"))
+        self.assertFalse(log_filter.should_exclude(b"xa"))
+
+
+class HyperscanFilterTests:
+    """HyperscanFilter 클래스 테스트 (실제 hyperscan과 대체 객체에서 공통으로 실행)"""
+
+    patterns = ["^\\s*$", "^DEBUG:", "^INFO: heartbeat$", "^(?=.*\\d)(?=.*[A-Za-z])[A-Za-z0-9]+$"]
+
+    def setUp(self):
+        """테스트 설정"""
+        super().setUp()
+        self.log_filter = HyperscanFilter("test_module", self.pattern_file)
+
+    def test_pattern_split(self):
+        """Hyperscan 미지원 패턴 분리 테스트"""
+        self.assertIsNotNone(self.log_filter.database)
+        self.assertEqual(self.log_filter.hyperscan_patterns, ["^DEBUG:", "^INFO: heartbeat$"])
+        # "\s", "\d"가 있는 패턴은 ASCII 라인용 로그 필터에서만 Hyperscan으로 검사
+        ascii_filter = self.log_filter.ascii_filter()
+        self.assertEqual(ascii_filter.hyperscan_patterns, ["^\\s*$", "^DEBUG:", "^INFO: heartbeat$"])
+        self.assertIsNotNone(ascii_filter.combined)
+        # 결합 패턴은 Hyperscan 미지원 패턴으로만 생성
+        self.assertEqual(ascii_filter._regex_patterns, ["^(?=.*\\d)(?=.*[A-Za-z])[A-Za-z0-9]+$"])
+
+    def test_should_exclude(self):
+        """로그 라인 제외 여부 테스트"""
+        self.assertTrue(self.log_filter.should_exclude(b"\n"))
+        self.assertTrue(self.log_filter.should_exclude(b"DEBUG: test message\n"))
+        self.assertTrue(self.log_filter.should_exclude(b"INFO: heartbeat\n"))
+        self.assertTrue(self.log_filter.should_exclude(b"abc123"))
+
+        self.assertFalse(self.log_filter.should_exclude(b"ERROR: test message\n"))
+        self.assertFalse(self.log_filter.should_exclude(b"abcdef"))
+
+    def test_single_line_scan(self):
+        """데이터 끝 라인의 매칭을 놓치지 않고 라인 하나를 스캔하는지 테스트"""
+        patterns = [
+            "^DEBUG:", "^INFO: heartbeat$", "specificString", "@b\\.com", "10\\.0\\.0\\.1",
+            "Created By", "x[0-3]$", "This Is", "zzz",
+        ]
+        line = "한글 로그 라인 123 x2".encode("utf-8")
+        for extra, block_scan in (([], True), (["^done\\Z"], False)):
+            self._write_patterns("test_module", patterns + extra)
+                
+            log_filter = HyperscanFilter("test_module", self.pattern_file)
+            self.assertEqual(log_filter._block_scan, block_scan)
+            self.assertTrue(log_filter.should_exclude(line))
+            self.assertTrue(log_filter.should_exclude(b"a x3\n"))
+            self.assertFalse(log_filter.should_exclude(b"x3 a"))
+            self.assertFalse(log_filter.should_exclude(b"zz\nz"))
+
+    def test_block_scan(self):
+        """블록 단위 스캔 결과가 라인 단위 검사 결과와 같은지 테스트"""
+        lines = [b"", b"DEBUG: x", b"plain a", b"keep", b"b", b"c", b"abc123", b"  ", b"ax y", b"x", b"end"]
+        cases = [
+            # Hyperscan이 데이터 끝 라인의 매칭을 놓치는 경우
+            (["a$"], b"b\nkeep\nabc123\nend\n\n\n"),
+            # "$" 매칭이 다음 라인 시작에서 끝나는 매칭보다 늦게 보고되는 경우
+            (["a$", "[\\n]"], b"plain a\nDEBUG: x\nend\nax y\nplain a\nDEBUG: x\nabc123\nDEBUG: x\nc\nax y\nend\n\n"),
+            (["a$", "x\\b", "b\\s+c"], b"\n".join(lines * 20) + b"\n"),
+        ]
+        patterns = list(self.pattern_data["test_module"]["patterns"])
+        for extra_patterns, buffer in cases:
+            self._write_patterns("test_module", patterns + extra_patterns)
+            log_filter = HyperscanFilter("test_module", self.pattern_file)
+            self.assertTrue(log_filter._block_scan)
+            reference = LogFilter("test_module", self.pattern_file)
+            
+            for block_size, block_scan_after in ((1, 0), (8, 0), (4096, 0), (4096, 8)):
+                with mock.patch.object(log_filter_module, "HYPERSCAN_MIN_BLOCK_SIZE", block_size), mock.patch.object(
+                    log_filter_module, "HYPERSCAN_BLOCK_SCAN_AFTER", block_scan_after
+                ):
+                    expected, out = io.BytesIO(), io.BytesIO()
+                    included_lines = _scan_and_emit(buffer, 0, len(buffer), log_filter, out)
+                self.assertEqual(included_lines, _scan_and_emit(buffer, 0, len(buffer), reference, expected))
+                self.assertEqual(out.getvalue(), expected.getvalue())
+
+
+
+class TestFakeHyperscanFilter(HyperscanFilterTests, PatternFileTestCase):
+    """re 모듈 기반 대체 객체로 실행하는 HyperscanFilter 테스트 (hyperscan 없이도 실행)"""
+
+    def setUp(self):
+        """테스트 설정"""
+        patch_fake_hyperscan(self)
+        super().setUp()
+
+
+@unittest.skipUnless(log_filter_module.hyperscan, "hyperscan이 설치되어 있지 않음")
+class TestHyperscanFilter(HyperscanFilterTests, PatternFileTestCase):
+    """실제 hyperscan으로 실행하는 HyperscanFilter 테스트"""
+
+    def test_save_and_load_database(self):
+        """데이터베이스 파일 저장 및 불러오기 테스트"""
+        path = self.log_filter.save_database()
+        self.assertEqual(path, os.path.join(self.temp_dir.name, "test_patterns.test_module.hsdb"))
+
+        with mock.patch.object(HyperscanFilter, "_build_database", side_effect=AssertionError):
+            log_filter = HyperscanFilter("test_module", self.pattern_file)
+        self.assertEqual(log_filter.hyperscan_patterns, self.log_filter.hyperscan_patterns)
+        self.assertTrue(log_filter.should_exclude(b"DEBUG: test message\n"))
+        self.assertTrue(log_filter.should_exclude(b"abc123"))
+        self.assertFalse(log_filter.should_exclude(b"ERROR: test message\n"))
+
+        # 패턴이 바뀌면 저장된 데이터베이스를 사용하지 않음
+        self._write_patterns("test_module", self.pattern_data["test_module"]["patterns"] + ["^ERROR:"])
+        log_filter = HyperscanFilter("test_module", self.pattern_file)
+        self.assertIn("^ERROR:", log_filter.hyperscan_patterns)
+        self.assertTrue(log_filter.should_exclude(b"ERROR: test message\n"))
+
+        # 읽을 수 없거나 헤더 형식이 올바르지 않은 파일은 무시
+        # 형식 버전이 다른 파일도 무시
+        for content in (
+            b"invalid",
+            b"[1, 2]\n",
+            b'{"module": "test_module", "patterns": 1}\n',
+            json.dumps({
+                "format": 1,
+                "module": "test_module",
+                "patterns": self.pattern_data["test_module"]["patterns"],
+                "supported": [],
+            }).encode("utf-8") + b"\n",
+        ):
+            with open(path, "wb") as f:
+                f.write(content)
+            log_filter = HyperscanFilter("test_module", self.pattern_file)
+            self.assertIn("^ERROR:", log_filter.hyperscan_patterns)
+            self.assertTrue(log_filter.should_exclude(b"ERROR: test message\n"))
+
+    def test_compile_patterns_cli(self):
+        """--compile-patterns 명령행 옵션 테스트"""
+        argv = ["log_filter.py", "--module", "test_module", "--pattern-file", self.pattern_file]
+        with mock.patch("sys.argv", argv + ["--compile-patterns"]):
+            log_filter_module.main()
+        self.assertTrue(os.path.exists(self.log_filter.database_path()))
+
+        with mock.patch("sys.argv", argv + ["--compile-patterns"]), mock.patch.object(
+            log_filter_module, "hyperscan", None
+        ):
+            with self.assertRaises(SystemExit) as cm:
+                log_filter_module.main()
+        self.assertEqual(cm.exception.code, 1)
+
+    def test_create_log_filter(self):
+        """로그 필터 생성 함수 테스트"""
+        with mock.patch.object(log_filter_module, "pyarrow", None):
+            log_filter = create_log_filter("test_module", self.pattern_file)
+        self.assertIsInstance(log_filter, HyperscanFilter)
+
+        # 저장된 데이터베이스 파일이 있어도 pyarrow가 설치되어 있으면 ArrowFilter 사용
+        self.log_filter.save_database()
+        with mock.patch.object(log_filter_module, "pyarrow", object()), mock.patch.object(
+            log_filter_module, "ArrowFilter"
+        ) as arrow_filter:
+            log_filter = create_log_filter("test_module", self.pattern_file)
+        self.assertIs(log_filter, arrow_filter.return_value)
+
+
+class ArrowFilterTests:
+    """ArrowFilter 클래스 테스트 (실제 pyarrow와 대체 객체에서 공통으로 실행)"""
+
+    patterns = ["^\\s*$", "^DEBUG:", "^INFO: heartbeat$", "^(?=.*\\d)(?=.*[A-Za-z])[A-Za-z0-9]+$"]
+
+    def setUp(self):
+        """테스트 설정"""
+        super().setUp()
+        self.log_filter = ArrowFilter("test_module", self.pattern_file)
+
+    def test_pattern_split(self):
+        """RE2 미지원 패턴 분리 테스트"""
+        self.assertEqual(self.log_filter.arrow_pattern, "(?:^DEBUG:)|(?:^INFO: heartbeat$)")
+        # "\s", "\d"가 있는 패턴은 ASCII 라인용 로그 필터에서만 Arrow로 검사
+        ascii_filter = self.log_filter.ascii_filter()
+        self.assertEqual(
+            ascii_filter.arrow_pattern,
+            "(?:^\\s*$)|(?:^DEBUG:)|(?:^INFO: heartbeat$)"
+        )
+        self.assertIsNotNone(ascii_filter.combined)
+        self.assertEqual(ascii_filter._regex_patterns, ["^(?=.*\\d)(?=.*[A-Za-z])[A-Za-z0-9]+$"])
+
+    def test_should_exclude(self):
+        """로그 라인 제외 여부 테스트"""
+        self.assertTrue(self.log_filter.should_exclude(b"\n"))
+        self.assertTrue(self.log_filter.should_exclude(b"DEBUG: test message\n"))
+        self.assertTrue(self.log_filter.should_exclude(b"INFO: heartbeat\r\n"))
+        self.assertTrue(self.log_filter.should_exclude(b"abc123"))
+
+        self.assertFalse(self.log_filter.should_exclude(b"ERROR: test message\n"))
+        self.assertFalse(self.log_filter.should_exclude(b"abcdef"))
+
+    def test_scan_batches(self):
+        """라인 묶음 단위 검사 테스트"""
+        buffer = (
+            b"ERROR: a\nDEBUG: b\nINFO: heartbeat\r\n"
+            b"abc123\nERROR: \xff\xfe\r\n\nERROR: c\r"
+        )
+        expected = b"ERROR: a\nERROR: \xff\xfe\r\nERROR: c\r"
+        for batch_size in (1, 16, 1024):
+            with mock.patch.object(log_filter_module, "BATCH_CHUNK_SIZE", batch_size):
+                output = io.BytesIO()
+                self.assertEqual(_scan_and_emit(buffer, 0, len(buffer), self.log_filter, output), 3)
+                self.assertEqual(output.getvalue(), expected)
+
+        output = io.BytesIO()
+        self.assertEqual(_scan_and_emit(buffer, 0, 9, self.log_filter, output), 1)
+        self.assertEqual(output.getvalue(), b"ERROR: a\n")
+
+    def test_create_log_filter(self):
+        """로그 필터 생성 함수 테스트"""
+        log_filter = create_log_filter("test_module", self.pattern_file)
+        self.assertIsInstance(log_filter, ArrowFilter)
+
+
+class TestFakeArrowFilter(ArrowFilterTests, PatternFileTestCase):
+    """re 모듈 기반 대체 객체로 실행하는 ArrowFilter 테스트 (pyarrow 없이도 실행)"""
+
+    def setUp(self):
+        """테스트 설정"""
+        patch_fake_pyarrow(self)
+        super().setUp()
+
+
+@unittest.skipUnless(log_filter_module.pyarrow, "pyarrow가 설치되어 있지 않음")
+class TestArrowFilter(ArrowFilterTests, PatternFileTestCase):
+    """실제 pyarrow로 실행하는 ArrowFilter 테스트"""
+
+
+class TestLogProcessor(PatternFileTestCase):
     """LogProcessor 클래스 테스트"""
+
+    patterns = ["^DEBUG:", "^INFO: heartbeat$"]
     
     def setUp(self):
         """테스트 설정"""
-        # 임시 디렉토리 생성
-        self.temp_dir = tempfile.TemporaryDirectory()
-        
-        # 임시 패턴 파일 생성
-        self.pattern_file = os.path.join(self.temp_dir.name, "test_patterns.json")
-        self.pattern_data = {
-            "test_module": {
-                "patterns": [
-                    "^DEBUG:",
-                    "^INFO: heartbeat$"
-                ]
-            }
-        }
-        with open(self.pattern_file, "w", encoding="utf-8") as f:
-            json.dump(self.pattern_data, f)
+        super().setUp()
         
         # 임시 로그 파일 생성
         self.input_file = os.path.join(self.temp_dir.name, "input.log")
@@ -152,10 +792,6 @@ class TestLogProcessor(unittest.TestCase):
         self.log_filter = LogFilter("test_module", self.pattern_file)
         self.log_processor = LogProcessor(self.log_filter)
     
-    def tearDown(self):
-        """테스트 정리"""
-        self.temp_dir.cleanup()
-    
     def test_process_file(self):
         """파일 처리 테스트"""
         # 파일 처리
@@ -173,6 +809,109 @@ class TestLogProcessor(unittest.TestCase):
         self.assertNotIn("DEBUG: test message", content)
         self.assertNotIn("INFO: heartbeat", content)
 
+    def test_scan_and_emit_range(self):
+        """버퍼 일부 구간 검사 테스트"""
+        buffer = b"DEBUG: a\nERROR: b\nINFO: heartbeat\nERROR: c\nINFO: d\n"
+        out = io.BytesIO()
+
+        # 두 번째 라인부터 네 번째 라인까지만 검사
+        included_lines = _scan_and_emit(buffer, 9, 43, self.log_filter, out)
+
+        self.assertEqual(included_lines, 2)
+        self.assertEqual(out.getvalue(), b"ERROR: b\nERROR: c\n")
+
+    def test_process_file_parallel(self):
+        """병렬 파일 처리 테스트"""
+        with open(self.input_file, "a", encoding="utf-8") as f:
+            for i in range(50):
+                f.write(f"DEBUG: message {i}\n")
+                f.write(f"ERROR: error {i}\n")
+
+        serial_output = os.path.join(self.temp_dir.name, "serial.log")
+        serial_lines = LogProcessor(self.log_filter, jobs=1).process_file(self.input_file, serial_output)
+
+        with open(self.input_file, "rb") as f:
+            data = f.read()
+
+        with mock.patch.object(log_filter_module, "PARALLEL_CHUNK_SIZE", 64):
+            processor = LogProcessor(self.log_filter, jobs=2)
+            self.assertGreater(len(processor._split_chunks(data)), 1)
+            included_lines = processor.process_file(self.input_file, self.output_file)
+
+        self.assertEqual(included_lines, serial_lines)
+        self.assertEqual(included_lines, 52)
+        with open(serial_output, "rb") as f1, open(self.output_file, "rb") as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    @unittest.skipUnless(hasattr(os, "writev"), "os.writev를 지원하지 않는 플랫폼")
+    def test_gather_writer(self):
+        """os.writev 출력 대상 테스트 (일부만 기록되는 경우 포함)"""
+        output_path = os.path.join(self.temp_dir.name, "gather.log")
+        chunks = [b"first\n", b"", b"second\n", bytearray(b"third")]
+        writev = os.writev
+        
+        def partial_writev(fd, buffers):
+            # 한 번에 최대 4바이트만 기록
+            return writev(fd, [b"".join(bytes(b) for b in buffers)[:4]])
+        
+        with open(output_path, "wb", buffering=0) as f:
+            writer = _GatherWriter(f.fileno())
+            with mock.patch.object(log_filter_module, "WRITEV_MAX_CHUNKS", 2):
+                with mock.patch.object(log_filter_module.os, "writev", side_effect=partial_writev):
+                    writer.writelines(chunks)
+            self.assertEqual(writer.write(b"!\n"), 2)
+            
+        with open(output_path, "rb") as f:
+            self.assertEqual(f.read(), b"first\nsecond\nthird!\n")
+
+        # process_file은 mmap을 복사하지 않고 memoryview 조각으로 전달하며, 일부만
+        # 기록되어도 조각을 모두 해제하므로 mmap을 정상적으로 닫음
+        received = []
+
+        def recording_writev(fd, buffers):
+            received.extend(type(b) for b in buffers)
+            return partial_writev(fd, buffers)
+
+        with mock.patch.object(log_filter_module.os, "writev", side_effect=recording_writev):
+            included_lines = self.log_processor.process_file(self.input_file, self.output_file)
+        self.assertEqual(included_lines, 2)
+        self.assertTrue(received)
+        self.assertTrue(all(issubclass(t, memoryview) for t in received))
+        with open(self.output_file, "rb") as f:
+            self.assertEqual(f.read(), b"ERROR: test error\nINFO: system started\n")
+
+    def test_process_empty_file(self):
+        """빈 파일 처리 테스트"""
+        open(self.input_file, "w").close()
+
+        included_lines = self.log_processor.process_file(self.input_file, self.output_file)
+
+        self.assertEqual(included_lines, 0)
+        self.assertTrue(os.path.exists(self.output_file))
+
+    def test_process_file_line_endings(self):
+        """CRLF 및 마지막 줄바꿈이 없는 파일 처리 테스트"""
+        with open(self.input_file, "wb") as f:
+            f.write(b"INFO: heartbeat\r\nERROR: test error\r\nDEBUG: test\nINFO: last")
+
+        included_lines = self.log_processor.process_file(self.input_file, self.output_file)
+
+        self.assertEqual(included_lines, 2)
+        with open(self.output_file, "rb") as f:
+            self.assertEqual(f.read(), b"ERROR: test error\r\nINFO: last")
+
+        # 라인은 줄바꿈 문자("\n", "\r\n")를 제외하고 검사하며, 출력의 줄바꿈은 바꾸지 않음
+        self._write_patterns("test_module", ["a\\s", "b\\n", "c[^x]$", "done\\Z"])
+        with open(self.input_file, "wb") as f:
+            f.write(b"a\nb\r\nc\r\ndone\r\ndone\nkeep\r\n")
+        for log_filter in (LogFilter("test_module", self.pattern_file), create_log_filter("test_module", self.pattern_file)):
+            os.remove(self.output_file)
+            included_lines = LogProcessor(log_filter).process_file(self.input_file, self.output_file)
+            
+            self.assertEqual(included_lines, 4)
+            with open(self.output_file, "rb") as f:
+                self.assertEqual(f.read(), b"a\nb\r\nc\r\nkeep\r\n")
+
 
 class TestPathResolver(unittest.TestCase):
     """PathResolver 클래스 테스트"""
@@ -212,6 +951,13 @@ class TestPathResolver(unittest.TestCase):
         self.assertTrue(path.startswith("/test/base/dir/result/default/test_module/"))
         self.assertTrue("test_module_" in path)
         self.assertTrue(path.endswith(".log"))
+        
+        # 기준 시각을 지정한 경우
+        path_resolver = PathResolver(self.base_dir, datetime(2024, 3, 5, 23, 59))
+        path = path_resolver.generate_output_path(None, "test_module", "default")
+        self.assertEqual(
+            path, "/test/base/dir/result/default/test_module/2024/03/test_module_20240305.log"
+        )
 
 
 if __name__ == "__main__":